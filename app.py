@@ -1,18 +1,31 @@
 import os
+import re
+import time
+import uuid
+import hashlib
 import logging
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+import threading
+import queue
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from flask.json.provider import DefaultJSONProvider
 from functools import wraps
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from werkzeug.utils import secure_filename
+from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.exceptions import RequestEntityTooLarge
 from datetime import datetime
 
-# Cloud 모듈 import
-from core.cloud_storage import CloudStorage
-from core.rag import RAGSystem
-
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 빠른 JSON 직렬화 (없으면 Flask 기본 JSON provider 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 환경 변수 로드
 try:
     from dotenv import load_dotenv
@@ -23,7 +36,27 @@ except ImportError:
 # 로컬 설정 로드
 # 온라인 전용 시스템으로 로컬 설정 불필요
 
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 JSON provider (jsonify/app.json 전체에 적용)"""
+    sort_keys = False
+    compact = True
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
+    
+    def _dumps_bytes(self, obj):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+app.json.sort_keys = False
+app.json.compact = True
 
 # 환경 변수 직접 설정
 IS_CLOUD_RUN = os.environ.get('ENVIRONMENT') == 'cloud'
@@ -36,7 +69,28 @@ app.secret_key = SECRET_KEY
 
 # 파일 업로드 설정
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt', 'md'}
+_ALLOWED_SUFFIXES = tuple(f'.{ext}' for ext in ALLOWED_EXTENSIONS)  # str.endswith용
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+MAX_REQUEST_SIZE = MAX_FILE_SIZE * 20  # 한 번에 여러 파일 업로드 허용
+
+# 요청 본문이 너무 크면 multipart 파싱 전에 413으로 거절
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_SIZE
+
+# JSON 응답 압축 (채팅 기록/상태 응답은 크기가 계속 커짐)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 512
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    logger.warning("⚠️ flask-compress가 설치되지 않아 응답 압축을 사용하지 않습니다.")
+UPLOAD_MAX_WORKERS = int(os.environ.get('UPLOAD_MAX_WORKERS', '8'))  # 동시 업로드 스레드 수
+EMBED_MAX_WORKERS = int(os.environ.get('EMBED_MAX_WORKERS', str((os.cpu_count() or 1) * 2)))  # 동시 임베딩 스레드 수
+STATUS_IO_WORKERS = int(os.environ.get('STATUS_IO_WORKERS', '4'))  # 상태 조회용 I/O 스레드 수
+
+# 상태 조회 시 서로 독립적인 GCS/RAG 호출을 동시에 실행하기 위한 공유 풀
+status_executor = ThreadPoolExecutor(max_workers=STATUS_IO_WORKERS, thread_name_prefix='status-io')
 
 # 사용자 계정
 USERS = {
@@ -44,6 +98,135 @@ USERS = {
     'user': {'password': '12345', 'role': 'user'}
 }
 
+# 시작 시 비밀번호를 해시로 변환 (검증은 check_password_hash의 상수 시간 비교 사용)
+USERS_HASHED = {
+    username: {'password_hash': generate_password_hash(info['password']), 'role': info['role']}
+    for username, info in USERS.items()
+}
+# 존재하지 않는 사용자도 같은 비용으로 검증해 응답 시간으로 계정 존재 여부가 드러나지 않게 함
+_DUMMY_PASSWORD_HASH = generate_password_hash(uuid.uuid4().hex)
+
+# 최근 로그인 성공 캐시 (반복 로그인 시 KDF 재계산 생략)
+LOGIN_CACHE_TTL = 300  # 5분
+LOGIN_CACHE_MAX = 1024
+_login_cache = {}  # (username, sha256(password)) -> 만료 시각
+_login_cache_lock = threading.Lock()  # gthread 워커의 여러 요청 스레드가 함께 정리/추가
+
+# 대화 히스토리 (서버 메모리에 보관, 쿠키 세션에는 sid만 저장)
+CHAT_HISTORY_MAX = 100
+CHAT_HISTORY_TTL = 24 * 60 * 60  # 마지막 대화 후 하루 보관
+CHAT_SESSION_MAX = int(os.environ.get('CHAT_SESSION_MAX', '10000'))  # 메모리에 보관할 최대 sid 수
+
+class ChatHistoryStore:
+    """sid -> 대화 히스토리 deque (로그아웃 없이 버려진 세션이 쌓이지 않도록 오래 쓰지 않은 sid부터 제거)"""
+    
+    def __init__(self, max_sessions, ttl):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._histories = OrderedDict()  # sid -> (마지막 사용 시각, deque), 최근 사용한 sid가 뒤쪽
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, sid):
+        now = time.time()
+        with self._lock:
+            entry = self._histories.pop(sid, None)
+            history = entry[1] if entry and now - entry[0] < self.ttl else deque(maxlen=CHAT_HISTORY_MAX)
+            self._histories[sid] = (now, history)
+            self._prune(now)
+            return history
+    
+    def __contains__(self, sid):
+        with self._lock:
+            entry = self._histories.get(sid)
+            return entry is not None and time.time() - entry[0] < self.ttl
+    
+    def pop(self, sid, default=None):
+        with self._lock:
+            entry = self._histories.pop(sid, None)
+            return entry[1] if entry else default
+    
+    def _prune(self, now):
+        """개수 한도를 넘었거나 ttl 동안 쓰지 않은 sid 제거 (self._lock 안에서 호출)"""
+        while self._histories:
+            last_used = next(iter(self._histories.values()))[0]
+            if len(self._histories) <= self.max_sessions and now - last_used < self.ttl:
+                break
+            self._histories.popitem(last=False)
+
+chat_histories = ChatHistoryStore(CHAT_SESSION_MAX, CHAT_HISTORY_TTL)
+
+# REDIS_URL이 설정되면 대화 히스토리를 Redis에 저장 (인스턴스 간 공유)
+REDIS_URL = os.environ.get('REDIS_URL')
+REDIS_SOCKET_TIMEOUT = float(os.environ.get('REDIS_SOCKET_TIMEOUT', '1.0'))  # 장애 시 요청이 오래 막히지 않도록 (초)
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT
+        )
+    except ImportError:
+        logger.warning("⚠️ redis 패키지가 없어 대화 히스토리를 메모리에 저장합니다.")
+
+class RedisChatHistory:
+    """Redis 리스트 기반 대화 히스토리 (deque와 같은 방식으로 사용)
+    
+    Redis 오류 시에는 이 인스턴스의 메모리 버퍼로 대신 처리 (상태 조회/질의가 500으로 실패하지 않도록)
+    """
+    
+    def __init__(self, client, sid):
+        self.client = client
+        self.sid = sid
+        self.key = f"chat_history:{sid}"
+    
+    def _fallback(self, error):
+        logger.warning(f"⚠️ Redis 대화 히스토리 사용 실패, 메모리 버퍼 사용: {error}")
+        return chat_histories[self.sid]
+    
+    def append(self, conversation):
+        # 추가, 최근 CHAT_HISTORY_MAX개만 유지, 만료 갱신을 한 번의 왕복으로 처리
+        try:
+            pipe = self.client.pipeline()
+            pipe.rpush(self.key, app.json.dumps(conversation))
+            pipe.ltrim(self.key, -CHAT_HISTORY_MAX, -1)
+            pipe.expire(self.key, CHAT_HISTORY_TTL)
+            pipe.execute()
+        except redis.exceptions.RedisError as e:
+            self._fallback(e).append(conversation)
+    
+    def clear(self):
+        chat_histories.pop(self.sid, None)
+        try:
+            self.client.delete(self.key)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"⚠️ Redis 대화 히스토리 삭제 실패: {e}")
+    
+    def __iter__(self):
+        try:
+            items = self.client.lrange(self.key, 0, -1)
+        except redis.exceptions.RedisError as e:
+            return iter(list(self._fallback(e)))
+        return (app.json.loads(item) for item in items)
+    
+    def __len__(self):
+        try:
+            return self.client.llen(self.key)
+        except redis.exceptions.RedisError as e:
+            logger.warning(f"⚠️ Redis 대화 히스토리 개수 조회 실패: {e}")
+            return len(chat_histories[self.sid]) if self.sid in chat_histories else 0
+
+# 시스템 지표 (백그라운드 스레드가 주기적으로 갱신, 요청 스레드는 읽기만 함)
+SYSTEM_STATS_INTERVAL = 2  # 초
+_system_stats = {}
+_system_sampler_lock = threading.Lock()
+_system_sampler_started = False
+
+# 짧은 TTL 캐시 (관리자 대시보드 폴링 대응)
+STATUS_CACHE_TTL = 5  # 초
+_ttl_cache = {}
+
 # RAG 시스템 초기화 (Cloud Run에서는 지연 로딩)
 rag_system = None
 storage = None
@@ -51,8 +234,185 @@ initialization_complete = False
 
 def allowed_file(filename):
     """허용된 파일 확장자 확인"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+# 최근 활동 로그에서 찾을 키워드 (bytes 단위로 매칭해 줄마다 디코딩/lower() 생략)
+ACTIVITY_PATTERN = re.compile(rb'upload|delete|embedding|query', re.IGNORECASE)
+
+def tail_lines(path, n, block_size=8192):
+    """파일 끝에서부터 블록 단위로 읽어 마지막 n줄(bytes) 반환"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        # 줄 수가 n을 넘을 때까지 뒤에서부터 블록을 읽음 (첫 줄은 잘려 있을 수 있음)
+        while pos > 0 and buf.count(b'\n') <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return buf.splitlines()[-n:]
+
+def read_capped(stream, cap):
+    """스트림에서 최대 cap 바이트까지만 읽음 (초과 시 ValueError, seek/tell 없이 한 번에 검사)"""
+    data = stream.read(cap + 1)
+    if len(data) > cap:
+        raise ValueError('too large')
+    return data
+
+def submit_bounded(executor, func, items, limit):
+    """items를 하나씩 꺼내 func(*item)으로 제출하되 동시에 limit개까지만 실행, 끝난 순서대로 (item, future) 반환
+    
+    items는 필요할 때 꺼내므로 제출을 기다리는 동안 다음 파일을 미리 읽어 두지 않음
+    """
+    in_flight = {}
+    for item in items:
+        if len(in_flight) >= limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future
+        in_flight[executor.submit(func, *item)] = item
+    for future in as_completed(in_flight):
+        yield in_flight.pop(future), future
+
+def verify_user(username, password):
+    """사용자 비밀번호 검증"""
+    if not username or not password:
+        return False
+    
+    user = USERS_HASHED.get(username)
+    if not user:
+        check_password_hash(_DUMMY_PASSWORD_HASH, password)
+        return False
+    
+    now = time.time()
+    cache_key = (username, hashlib.sha256(password.encode('utf-8')).hexdigest())
+    expires_at = _login_cache.get(cache_key)
+    if expires_at and expires_at > now:
+        return True
+    
+    if not check_password_hash(user['password_hash'], password):
+        return False
+    
+    with _login_cache_lock:
+        # 캐시가 커지면 만료된 항목 정리
+        if len(_login_cache) >= LOGIN_CACHE_MAX:
+            for key in [k for k, v in _login_cache.items() if v <= now]:
+                del _login_cache[key]
+            if len(_login_cache) >= LOGIN_CACHE_MAX:
+                _login_cache.clear()
+        _login_cache[cache_key] = now + LOGIN_CACHE_TTL
+    return True
+
+# flask-compress가 압축한 응답의 ETag 끝에 붙이는 표시 ("<md5>" -> "<md5>:gzip")
+COMPRESSED_ETAG_SUFFIXES = (':gzip', ':deflate', ':br')
+
+def etag_matches(etag):
+    """If-None-Match에 etag가 있는지 확인 (압축 응답으로 받은 "<etag>:gzip" 형태도 같은 값으로 봄)"""
+    candidates = (etag,) + tuple(etag + suffix for suffix in COMPRESSED_ETAG_SUFFIXES)
+    return any(candidate in request.if_none_match for candidate in candidates)
+
+def conditional_json(payload, cache_control='private, no-cache'):
+    """ETag를 붙인 JSON 응답 (If-None-Match가 일치하면 본문 없이 304, 압축 응답의 ETag도 인정)"""
+    response = jsonify(payload)
+    etag = hashlib.md5(response.get_data()).hexdigest()
+    if etag_matches(etag):
+        response = app.response_class(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def cached_list_files():
+    """요청 하나 안에서 storage.list_files() 결과 재사용"""
+    if 'files' not in g:
+        g.files = storage.list_files()
+    return g.files
+
+def cached_call(key, func, ttl=STATUS_CACHE_TTL):
+    """func() 결과를 ttl초 동안 캐시해서 반환"""
+    now = time.time()
+    cached = _ttl_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    value = func()
+    _ttl_cache[key] = (now, value)
+    return value
+
+def gather_status():
+    """RAG 상태와 저장소 정보를 동시에 조회 -> (rag_status, storage_info)"""
+    rag_future = status_executor.submit(cached_call, 'rag_status', rag_system.get_status) if rag_system else None
+    storage_future = status_executor.submit(cached_call, 'storage_info', storage.get_storage_info) if storage else None
+    rag_status = rag_future.result() if rag_future else {}
+    storage_info = storage_future.result() if storage_future else {}
+    return rag_status, storage_info
+
+# 파일/인덱스 상태를 바꾸는 엔드포인트 (질의·검색 테스트처럼 읽기만 하는 POST는 제외)
+STATE_CHANGING_ENDPOINTS = frozenset({
+    'upload_file', 'upload_and_embed', 'delete_file', 'batch_delete_files',
+    'rebuild_embeddings', 'embed_selected_files', 'delete_all_files', 'update_embeddings',
+    'clear_index', 'force_sync_embeddings', 'delete_specific_embedding', 'restore_vectors',
+    'update_settings',
+})
+
+@app.after_request
+def invalidate_cached_status(response):
+    """상태를 바꾸는 API 요청이 성공하면 TTL 캐시 비움 (대시보드가 바로 새 값을 보도록)"""
+    if request.endpoint in STATE_CHANGING_ENDPOINTS and response.status_code < 400:
+        _ttl_cache.clear()
+    return response
+
+def _system_stats_sampler():
+    """CPU/메모리 사용량을 주기적으로 측정 (cpu_percent가 interval 동안 블로킹하므로 별도 스레드에서 실행)"""
+    import psutil
+    while True:
+        try:
+            cpu_percent = psutil.cpu_percent(interval=SYSTEM_STATS_INTERVAL)
+            _system_stats['cpu_percent'] = cpu_percent
+            _system_stats['memory'] = psutil.virtual_memory()
+        except Exception as e:
+            logger.warning(f"⚠️ 시스템 지표 측정 실패: {e}")
+            time.sleep(SYSTEM_STATS_INTERVAL)
+
+def get_system_stats():
+    """최근 측정된 시스템 지표 반환 (최초 호출 시 측정 스레드 시작)"""
+    global _system_sampler_started
+    import psutil
+    
+    if not _system_sampler_started:
+        with _system_sampler_lock:
+            if not _system_sampler_started:
+                # 첫 응답용 기준값 (interval=None은 블로킹하지 않음)
+                _system_stats['cpu_percent'] = psutil.cpu_percent(interval=None)
+                _system_stats['memory'] = psutil.virtual_memory()
+                threading.Thread(target=_system_stats_sampler, daemon=True).start()
+                _system_sampler_started = True
+    
+    return _system_stats['cpu_percent'], _system_stats['memory']
+
+def get_chat_history_buffer():
+    """현재 세션의 대화 히스토리 버퍼 반환 (sid가 없으면 새로 발급)"""
+    sid = session.get('sid')
+    if not sid:
+        sid = uuid.uuid4().hex
+        session['sid'] = sid
+    if redis_client is not None:
+        return RedisChatHistory(redis_client, sid)
+    return chat_histories[sid]
+
+def get_chat_history_count(sid):
+    """sid의 대화 히스토리 개수 (버퍼를 새로 만들지 않음)"""
+    if not sid:
+        return 0
+    if redis_client is not None:
+        return len(RedisChatHistory(redis_client, sid))
+    return len(chat_histories[sid]) if sid in chat_histories else 0
+
+def drop_chat_history(sid):
+    """sid의 대화 히스토리 삭제"""
+    if redis_client is not None:
+        RedisChatHistory(redis_client, sid).clear()
+    else:
+        chat_histories.pop(sid, None)
 
 def ensure_initialization():
     """필요할 때만 초기화 실행"""
@@ -73,6 +433,10 @@ def ensure_initialization():
         logger.info(f"프로젝트 ID: {gcp_project_id}")
         logger.info(f"버킷 이름: {gcs_bucket_name}")
         
+        # Cloud 모듈 import (google-cloud-storage, openai, numpy 로딩 비용을 첫 사용 시점으로 미룸)
+        from core.cloud_storage import CloudStorage
+        from core.rag import RAGSystem
+        
         if is_cloud_run and gcp_project_id and gcs_bucket_name:
             # Cloud Storage 초기화
             storage = CloudStorage(
@@ -103,23 +467,21 @@ def ensure_initialization():
         return False
 
 # 데코레이터
-def login_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('authenticated'):
-            return redirect(url_for('login'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def admin_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('authenticated'):
-            return redirect(url_for('login'))
-        if session.get('role') != 'admin':
-            return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
-        return f(*args, **kwargs)
-    return decorated_function
+def require(role=None):
+    """로그인 및 (지정 시) 역할 확인 데코레이터 생성"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not session.get('authenticated'):
+                return redirect(url_for('login'))
+            if role and session.get('role') != role:
+                return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+login_required = require()
+admin_required = require(role='admin')
 
 # 라우트
 @app.route('/')
@@ -133,10 +495,11 @@ def login():
         username = request.form.get('username')
         password = request.form.get('password')
         
-        if username in USERS and USERS[username]['password'] == password:
+        if verify_user(username, password):
             session['authenticated'] = True
             session['username'] = username
-            session['role'] = USERS[username]['role']
+            session['role'] = USERS_HASHED[username]['role']
+            session['sid'] = uuid.uuid4().hex
             return redirect(url_for('index'))
         else:
             return render_template('login.html', error='잘못된 사용자명 또는 비밀번호입니다.')
@@ -145,6 +508,9 @@ def login():
 
 @app.route('/logout')
 def logout():
+    sid = session.get('sid')
+    if sid:
+        drop_chat_history(sid)
     session.clear()
     return redirect(url_for('login'))
 
@@ -162,7 +528,7 @@ def admin():
                                  storage_info={}, 
                                  rag_status={})
         
-        files = storage.list_files()
+        files = cached_list_files()
         storage_info = storage.get_storage_info()
         rag_status = rag_system.get_status() if rag_system else {}
         
@@ -190,27 +556,21 @@ def query():
         if not question:
             return jsonify({'error': '질문을 입력해주세요.'}), 400
         
-        # 세션에서 대화 히스토리 가져오기
-        chat_history = session.get('chat_history', [])
+        # 서버 측 대화 히스토리 가져오기
+        chat_history = get_chat_history_buffer()
         
         # RAG 시스템으로 질의 (맥락 포함)
-        answer = rag_system.query(question, chat_history)
+        answer = rag_system.query(question, list(chat_history))
         
         # 새 대화를 히스토리에 추가
         new_conversation = {
             'question': question,
             'answer': answer,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time_ns()  # 조회 시점에 ISO 형식으로 변환
         }
+        # 최대 100개 대화만 유지 (deque maxlen으로 오래된 대화 자동 제거)
         chat_history.append(new_conversation)
         
-        # 최대 100개 대화만 유지 (메모리 관리)
-        if len(chat_history) > 100:
-            chat_history = chat_history[-100:]
-        
-        # 세션에 히스토리 저장
-        session['chat_history'] = chat_history
-        
         return jsonify({
             'answer': answer,
             'question': question,
@@ -237,41 +597,93 @@ def upload_file():
         
         uploaded_files = []
         failed_files = []
+        # ?async=1 이면 업로드를 백그라운드 작업으로 넘기고 task_id만 바로 반환
+        run_async = request.args.get('async') == '1'
         
-        for file in files:
-            try:
-                # 파일 형식 검증
+        def allowed_files():
+            """형식 검증을 통과한 파일을 하나씩 반환"""
+            for file in files:
                 if not allowed_file(file.filename):
                     failed_files.append({
                         'filename': file.filename,
                         'error': f'지원하지 않는 파일 형식입니다. 허용된 형식: {", ".join(ALLOWED_EXTENSIONS)}'
                     })
                     continue
-                
-                # 파일 크기 검증
-                file.seek(0, 2)
-                file_size = file.tell()
-                file.seek(0)
-                
-                if file_size > MAX_FILE_SIZE:
+                yield file
+        
+        queue_full = False
+        if run_async:
+            # 응답 후에는 요청 스트림을 읽을 수 없으므로 내용을 메모리로 읽어 백그라운드 작업으로 넘김
+            for file in allowed_files():
+                try:
+                    # 파일 크기 검증 (최대 크기 + 1 바이트까지만 읽어 판별)
+                    data = read_capped(file.stream, MAX_FILE_SIZE)
+                    task = storage.submit_upload(file.filename, data, file.mimetype)
+                    uploaded_files.append({
+                        'filename': file.filename,
+                        'url': task['url'],
+                        'task_id': task['task_id'],
+                        'status': task['status']
+                    })
+                except ValueError:
                     failed_files.append({
                         'filename': file.filename,
                         'error': f'파일 크기가 너무 큽니다. 최대 크기: {MAX_FILE_SIZE // (1024*1024)}MB'
                     })
-                    continue
-                
-                # 파일 업로드
-                file_url = storage.upload_file(file)
-                uploaded_files.append({
-                    'filename': file.filename,
-                    'url': file_url
-                })
-                
-            except Exception as e:
-                failed_files.append({
-                    'filename': file.filename,
-                    'error': str(e)
-                })
+                except queue.Full:
+                    # 대기열이 가득 차면 나머지 파일은 읽지 않고 잠시 후 다시 시도하도록 응답
+                    queue_full = True
+                    failed_files.append({
+                        'filename': file.filename,
+                        'error': '업로드 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.'
+                    })
+                    break
+                except Exception as e:
+                    failed_files.append({
+                        'filename': file.filename,
+                        'error': str(e)
+                    })
+        else:
+            # 요청 스트림을 그대로 GCS로 전송 (크기 초과는 업로드 전에 ValueError)
+            # 여러 파일을 동시에 올려 GCS 왕복 대기를 겹치되, 동시 업로드 수는 제한
+            with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+                uploads = ((file, MAX_FILE_SIZE) for file in allowed_files())
+                for (file, _), future in submit_bounded(executor, storage.upload_file, uploads, UPLOAD_MAX_WORKERS):
+                    try:
+                        uploaded_files.append({
+                            'filename': file.filename,
+                            'url': future.result()
+                        })
+                    except ValueError:
+                        failed_files.append({
+                            'filename': file.filename,
+                            'error': f'파일 크기가 너무 큽니다. 최대 크기: {MAX_FILE_SIZE // (1024*1024)}MB'
+                        })
+                    except Exception as e:
+                        failed_files.append({
+                            'filename': file.filename,
+                            'error': str(e)
+                        })
+        
+        if queue_full:
+            response = jsonify({
+                'error': '업로드 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.',
+                'uploaded_files': uploaded_files,
+                'failed_files': failed_files,
+                'total_uploaded': len(uploaded_files),
+                'total_failed': len(failed_files)
+            })
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        
+        if run_async:
+            return jsonify({
+                'message': f'{len(uploaded_files)}개 파일 업로드가 시작되었습니다.',
+                'uploaded_files': uploaded_files,
+                'failed_files': failed_files,
+                'total_uploaded': len(uploaded_files),
+                'total_failed': len(failed_files)
+            }), 202
         
         return jsonify({
             'message': f'{len(uploaded_files)}개 파일이 성공적으로 업로드되었습니다.',
@@ -281,12 +693,25 @@ def upload_file():
             'total_failed': len(failed_files)
         })
         
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         logger.error(f"파일 업로드 중 오류: {e}")
         return jsonify({'error': '파일 업로드 중 오류가 발생했습니다.'}), 500
 
+@app.route('/api/upload-status/<task_id>', methods=['GET'])
+@admin_required
+def get_upload_status(task_id):
+    """백그라운드 업로드 작업 상태 조회"""
+    if not storage:
+        return jsonify({'error': '스토리지가 초기화되지 않았습니다.'}), 500
+    
+    task = storage.get_upload_status(task_id)
+    if not task:
+        return jsonify({'error': '업로드 작업을 찾을 수 없습니다.'}), 404
+    return jsonify(task)
+
 @app.route('/api/upload-and-embed', methods=['POST'])
-@login_required
 @admin_required
 def upload_and_embed():
     """파일 업로드 후 즉시 임베딩"""
@@ -306,43 +731,84 @@ def upload_and_embed():
         uploaded_files = []
         failed_files = []
         
-        for file in files:
-            if file and file.filename:
-                try:
+        def read_files():
+            """파일을 하나씩 읽어 (파일명, 내용, 형식) 반환 (업로드 스레드 하나에서만 스트림을 읽음)"""
+            for file in files:
+                if file and file.filename:
+                    try:
+                        data = read_capped(file.stream, MAX_FILE_SIZE)
+                    except ValueError:
+                        logger.warning(f"⚠️ 파일 크기 초과: {file.filename}")
+                        with results_lock:
+                            failed_files.append(file.filename)
+                        continue
+                    except Exception as e:
+                        logger.error(f"❌ 파일 읽기 실패: {file.filename} - {e}")
+                        with results_lock:
+                            failed_files.append(file.filename)
+                        continue
                     logger.info(f"📄 파일 업로드 중: {file.filename}")
-                    file_url = storage.upload_file(file)
-                    
-                    # file_url에서 파일명 추출 (local://timestamp_filename 형식)
-                    filename = file_url.replace('local://', '')
-                    uploaded_files.append(filename)
-                    
-                    logger.info(f"✅ 파일 업로드 완료: {filename}")
-                    
-                    # 즉시 임베딩
-                    if rag_system:
+                    yield file.filename, data, file.mimetype
+        
+        # 업로드 → 추출/분할 → 임베딩 파이프라인
+        # 업로드가 끝난 파일부터 큐에 넣어 다른 파일 업로드와 임베딩이 겹쳐 실행되도록 함
+        upload_queue = queue.Queue(maxsize=4)
+        upload_metadata = {}
+        results_lock = threading.Lock()
+        
+        def upload_worker():
+            try:
+                # 읽은 파일은 바로 업로드를 시작하되 메모리에 올라가는 파일 수는 동시 업로드 수로 제한, 완료되는 순서대로 임베딩 단계로 넘김
+                with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+                    for (original_filename, _, _), future in submit_bounded(executor, storage.upload_bytes, read_files(), UPLOAD_MAX_WORKERS):
                         try:
-                            rag_system.add_document(file_url, filename)
-                            # 임베딩 상태 즉시 업데이트
-                            try:
-                                storage.mark_embedding_status(filename, True)
-                                logger.info(f"✅ 임베딩 상태 업데이트 완료: {filename}")
-                            except Exception as status_error:
-                                logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {filename} - {status_error}")
-                            logger.info(f"✅ 임베딩 완료: {filename}")
+                            file_url = future.result()
+                            
+                            # file_url에서 파일명 추출 (local://timestamp_filename 형식)
+                            filename = file_url.replace('local://', '')
+                            stored_filename = filename.split('/')[-1]
+                            upload_metadata[stored_filename] = {'original_name': original_filename}
+                            with results_lock:
+                                uploaded_files.append(filename)
+                            upload_queue.put((file_url, filename))
+                            
+                            logger.info(f"✅ 파일 업로드 완료: {filename}")
                         except Exception as e:
-                            logger.error(f"❌ 임베딩 실패: {filename} - {e}")
-                            # 임베딩 실패 시 상태 업데이트
-                            try:
-                                storage.mark_embedding_status(filename, False)
-                                logger.info(f"✅ 임베딩 실패 상태 업데이트 완료: {filename}")
-                            except Exception as status_error:
-                                logger.warning(f"⚠️ 임베딩 실패 상태 업데이트 실패: {filename} - {status_error}")
-                    else:
-                        logger.warning("⚠️ RAG 시스템이 초기화되지 않았습니다.")
-                        
-                except Exception as e:
-                    logger.error(f"❌ 파일 업로드 실패: {file.filename} - {e}")
-                    failed_files.append(file.filename)
+                            logger.error(f"❌ 파일 업로드 실패: {original_filename} - {e}")
+                            with results_lock:
+                                failed_files.append(original_filename)
+            finally:
+                upload_queue.put(None)
+        
+        uploader = threading.Thread(target=upload_worker, name='upload-pipeline', daemon=True)
+        uploader.start()
+        
+        if rag_system:
+            def on_document_done(stored_filename, success):
+                try:
+                    storage.mark_embedding_status(stored_filename, success)
+                    logger.info(f"✅ 임베딩 상태 업데이트 완료: {stored_filename} -> {success}")
+                except Exception as status_error:
+                    logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {stored_filename} - {status_error}")
+                if success:
+                    logger.info(f"✅ 임베딩 완료: {stored_filename}")
+                else:
+                    logger.error(f"❌ 임베딩 실패: {stored_filename}")
+            
+            try:
+                rag_system.add_documents_batch(iter(upload_queue.get, None), on_document_done=on_document_done, metadata=upload_metadata)
+            except Exception as e:
+                logger.error(f"❌ 배치 임베딩 실패: {e}")
+        else:
+            logger.warning("⚠️ RAG 시스템이 초기화되지 않았습니다.")
+        
+        # 임베딩 단계가 일찍 끝나도 업로드 스레드가 막히지 않도록 남은 항목을 비운 뒤 대기
+        while uploader.is_alive() or not upload_queue.empty():
+            try:
+                upload_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        uploader.join()
         
         if uploaded_files:
             message = f'{len(uploaded_files)}개 파일이 업로드되고 임베딩되었습니다.'
@@ -359,6 +825,8 @@ def upload_and_embed():
             logger.error("❌ 모든 파일 업로드 실패")
             return jsonify({'error': '파일 업로드에 실패했습니다.'}), 500
             
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         logger.error(f"❌ 업로드 및 임베딩 중 오류: {e}")
         return jsonify({'error': f'오류가 발생했습니다: {str(e)}'}), 500
@@ -382,12 +850,8 @@ def delete_file(filename):
         if rag_system:
             try:
                 # 저장된 파일 목록에서 해당 파일의 원본 이름 찾기
-                files = storage.list_files()
-                original_name = None
-                for file_info in files:
-                    if file_info['filename'] == decoded_filename:
-                        original_name = file_info['name']
-                        break
+                file_info = storage.get_file_info(decoded_filename)
+                original_name = file_info['name'] if file_info else None
                 
                 if original_name:
                     # 원본 파일명으로 제거 시도
@@ -413,10 +877,8 @@ def delete_file(filename):
             try:
                 logger.info("🗑️ 파일 삭제 후 pkl 파일 강제 삭제 시도")
                 rag_system._delete_vector_store()
-                # 메모리에서도 초기화
-                rag_system.documents = []
-                rag_system.embeddings = []
-                rag_system.vector_store = {}
+                # 메모리에서도 초기화 (검색/임베딩 캐시 포함)
+                rag_system.clear_memory()
                 logger.info("✅ pkl 파일 강제 삭제 및 메모리 초기화 완료")
             except Exception as e:
                 logger.error(f"❌ pkl 파일 강제 삭제 실패: {e}")
@@ -440,9 +902,9 @@ def list_files():
             logger.error("❌ 스토리지가 초기화되지 않았습니다.")
             return jsonify({'error': '스토리지가 초기화되지 않았습니다.'}), 500
         
-        files = storage.list_files()
+        files = cached_list_files()
         logger.info(f"✅ 파일 목록 조회 완료: {len(files)}개 파일")
-        return jsonify({'files': files})
+        return conditional_json({'files': files})
     except Exception as e:
         logger.error(f"❌ 파일 목록 조회 중 오류: {e}")
         return jsonify({'error': f'파일 목록 조회에 실패했습니다: {str(e)}'}), 500
@@ -467,15 +929,13 @@ def batch_delete_files():
         
         # 먼저 RAG 시스템에서 문서 제거 (파일이 삭제되기 전에)
         if rag_system:
+            # 파일 목록은 한 번만 읽어 조회용 색인 구성 (목록에 없는 파일마다 다시 읽지 않음)
+            by_filename = {f.get('filename'): f for f in cached_list_files()}
             for filename in filenames:
                 try:
-                    # 저장된 파일 목록에서 해당 파일의 원본 이름 찾기
-                    files = storage.list_files()
-                    original_name = None
-                    for file_info in files:
-                        if file_info['filename'] == filename:
-                            original_name = file_info['name']
-                            break
+                    # 파일 색인에서 해당 파일의 원본 이름 찾기
+                    file_info = by_filename.get(filename)
+                    original_name = file_info['name'] if file_info else None
                     
                     if original_name:
                         success = rag_system.remove_document(original_name)
@@ -498,10 +958,8 @@ def batch_delete_files():
             try:
                 logger.info("🗑️ 배치 파일 삭제 후 pkl 파일 강제 삭제 시도")
                 rag_system._delete_vector_store()
-                # 메모리에서도 초기화
-                rag_system.documents = []
-                rag_system.embeddings = []
-                rag_system.vector_store = {}
+                # 메모리에서도 초기화 (검색/임베딩 캐시 포함)
+                rag_system.clear_memory()
                 logger.info("✅ 배치 삭제 후 pkl 파일 강제 삭제 및 메모리 초기화 완료")
             except Exception as e:
                 logger.error(f"❌ 배치 삭제 후 pkl 파일 강제 삭제 실패: {e}")
@@ -531,40 +989,46 @@ def rebuild_embeddings():
         rag_system.clear_index()
         
         # 모든 파일에 대해 임베딩 재생성
-        files = storage.list_files()
-        embedded_count = 0
-        failed_count = 0
+        files = cached_list_files()
         
         logger.info(f"🔄 전체 임베딩 재구성 시작: {len(files)}개 파일")
         
-        for file_info in files:
+        def _embed_one(file_info):
+            """파일 하나 임베딩 -> (성공 여부, 파일명, 오류)"""
+            filename = file_info.get('name', file_info.get('filename', ''))
             try:
                 file_url = file_info.get('url')
-                filename = file_info.get('name', file_info.get('filename', ''))
                 stored_filename = file_info.get('filename', '')
                 
-                if file_url and filename:
-                    logger.info(f"📄 임베딩 시작: {filename}")
-                    success = rag_system.add_document(file_url, stored_filename)
-                    if success:
-                        # 임베딩 상태 업데이트
-                        try:
-                            storage.mark_embedding_status(stored_filename, True)
-                            logger.info(f"✅ 임베딩 완료: {filename}")
-                        except Exception as status_error:
-                            logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {filename} - {status_error}")
-                        embedded_count += 1
-                    else:
-                        logger.error(f"❌ 임베딩 실패: {filename}")
-                        failed_count += 1
-                else:
+                if not (file_url and filename):
                     logger.warning(f"⚠️ 파일 정보 누락: {file_info}")
-                    failed_count += 1
-                    
+                    return False, filename, '파일 정보 누락'
+                
+                logger.info(f"📄 임베딩 시작: {filename}")
+                # 벡터 저장소는 모든 파일 처리 후 한 번만 저장
+                success = rag_system.add_document(file_url, stored_filename, save=False)
+                if not success:
+                    logger.error(f"❌ 임베딩 실패: {filename}")
+                    return False, filename, '임베딩 실패'
+                
+                # 임베딩 상태 업데이트
+                try:
+                    storage.mark_embedding_status(stored_filename, True)
+                    logger.info(f"✅ 임베딩 완료: {filename}")
+                except Exception as status_error:
+                    logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {filename} - {status_error}")
+                return True, filename, None
+                
             except Exception as e:
                 logger.error(f"❌ 파일 임베딩 실패: {filename} - {e}")
-                failed_count += 1
-                continue
+                return False, filename, str(e)
+        
+        # 임베딩 API 대기 시간이 대부분이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=max(1, EMBED_MAX_WORKERS)) as executor:
+            results = list(executor.map(_embed_one, files))
+        
+        embedded_count = sum(1 for success, _, _ in results if success)
+        failed_count = len(results) - embedded_count
         
         # 벡터 저장소 강제 저장
         try:
@@ -573,10 +1037,11 @@ def rebuild_embeddings():
         except Exception as save_error:
             logger.error(f"❌ 벡터 저장소 강제 저장 실패: {save_error}")
         
-        logger.info(f"✅ 전체 임베딩 재구성 완료: {embedded_count}개 파일")
+        logger.info(f"✅ 전체 임베딩 재구성 완료: {embedded_count}개 성공, {failed_count}개 실패")
         return jsonify({
             'message': f'{embedded_count}개 파일의 임베딩이 재구성되었습니다.',
-            'embedded_count': embedded_count
+            'embedded_count': embedded_count,
+            'failed_count': failed_count
         })
         
     except Exception as e:
@@ -599,44 +1064,47 @@ def embed_selected_files():
         if not filenames:
             return jsonify({'error': '임베딩할 파일이 선택되지 않았습니다.'}), 400
         
-        # 선택된 파일들만 임베딩
-        embedded_count = 0
-        failed_files = []
+        # 파일 정보는 한 번만 조회
+        by_filename = {f.get('filename'): f for f in cached_list_files()}
         
-        for filename in filenames:
+        def _embed_one(filename):
+            """선택된 파일 하나 임베딩 -> (성공 여부, 파일명, 오류)"""
             try:
-                # 파일 정보 조회
-                files = storage.list_files()
-                file_info = next((f for f in files if f.get('filename') == filename), None)
+                file_info = by_filename.get(filename)
                 
-                if file_info and file_info.get('url'):
-                    file_url = file_info['url']
-                    display_name = file_info.get('name', filename)
-                    
-                    # 새로 임베딩 (기존 임베딩은 자동으로 덮어쓰기됨)
-                    success = rag_system.add_document(file_url, filename)
-                    if success:
-                        logger.info(f"✅ 선택 임베딩 완료: {display_name}")
-                        
-                        # 임베딩 상태 업데이트
-                        try:
-                            storage.mark_embedding_status(filename, True)
-                            logger.info(f"✅ 임베딩 상태 업데이트 완료: {display_name}")
-                        except Exception as status_error:
-                            logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {display_name} - {status_error}")
-                        
-                        embedded_count += 1
-                    else:
-                        logger.error(f"❌ 선택 임베딩 실패: {display_name}")
-                        failed_files.append(filename)
-                else:
+                if not (file_info and file_info.get('url')):
                     logger.warning(f"⚠️ 파일을 찾을 수 없음: {filename}")
-                    failed_files.append(filename)
-                    
+                    return False, filename, '파일을 찾을 수 없음'
+                
+                file_url = file_info['url']
+                display_name = file_info.get('name', filename)
+                
+                # 새로 임베딩 (기존 임베딩은 자동으로 덮어쓰기됨, 저장은 마지막에 한 번)
+                success = rag_system.add_document(file_url, filename, save=False)
+                if not success:
+                    logger.error(f"❌ 선택 임베딩 실패: {display_name}")
+                    return False, filename, '임베딩 실패'
+                
+                logger.info(f"✅ 선택 임베딩 완료: {display_name}")
+                
+                # 임베딩 상태 업데이트
+                try:
+                    storage.mark_embedding_status(filename, True)
+                    logger.info(f"✅ 임베딩 상태 업데이트 완료: {display_name}")
+                except Exception as status_error:
+                    logger.warning(f"⚠️ 임베딩 상태 업데이트 실패: {display_name} - {status_error}")
+                return True, filename, None
+                
             except Exception as e:
                 logger.error(f"❌ 선택 임베딩 실패: {filename} - {e}")
-                failed_files.append(filename)
-                continue
+                return False, filename, str(e)
+        
+        # 선택된 파일들만 병렬로 임베딩
+        with ThreadPoolExecutor(max_workers=max(1, EMBED_MAX_WORKERS)) as executor:
+            results = list(executor.map(_embed_one, filenames))
+        
+        embedded_count = sum(1 for success, _, _ in results if success)
+        failed_files = [name for success, name, _ in results if not success]
         
         # 벡터 저장소 강제 저장
         try:
@@ -684,7 +1152,6 @@ def delete_all_files():
         return jsonify({'error': '전체 파일 삭제 중 오류가 발생했습니다.'}), 500
 
 @app.route('/api/admin/update-embeddings', methods=['POST'])
-@login_required
 @admin_required
 def update_embeddings():
     """선택된 파일들 또는 전체 파일에 대해 임베딩 업데이트"""
@@ -692,19 +1159,23 @@ def update_embeddings():
         data = request.get_json() or {}
         filenames = data.get('filenames', [])
         
+        files = cached_list_files()
         if filenames:
             # 선택된 파일들만 임베딩
-            for filename in filenames:
-                rag_system.add_document(filename)
+            by_filename = {f.get('filename'): f for f in files}
+            targets = [by_filename[filename] for filename in filenames if filename in by_filename]
             message = f'{len(filenames)}개 파일의 임베딩이 완료되었습니다.'
         else:
             # 전체 파일 임베딩
-            files = storage.list_files()
-            for file_info in files:
-                if not file_info.get('has_embedding', False):
-                    rag_system.add_document(file_info['filename'])
+            targets = [f for f in files if not f.get('has_embedding', False)]
             message = '전체 파일의 임베딩이 완료되었습니다.'
         
+        # 파일마다 벡터 저장소를 다시 쓰지 않도록 끝날 때 한 번만 저장
+        with rag_system._batched_save():
+            for file_info in targets:
+                if file_info.get('url'):
+                    rag_system.add_document(file_info['url'], file_info['filename'])
+            
         return jsonify({'message': message})
         
     except Exception as e:
@@ -738,41 +1209,43 @@ def force_sync_embeddings():
         logger.info("🔄 강제 동기화 시작")
         
         # 모든 파일 조회
-        files = storage.list_files()
+        files = cached_list_files()
         logger.info(f"📁 스토리지에서 {len(files)}개 파일 발견")
         
         embedded_count = 0
         failed_count = 0
         
-        for file_info in files:
-            try:
-                file_url = file_info.get('url')
-                original_name = file_info.get('name')
-                stored_filename = file_info.get('filename')
-                has_embedding = file_info.get('has_embedding', False)
-                
-                logger.info(f"📄 파일 정보: {original_name} -> {stored_filename} (URL: {file_url}, 임베딩: {has_embedding})")
-                
-                if file_url and stored_filename:
-                    if not has_embedding:
-                        logger.info(f"📄 강제 임베딩 시작: {original_name}")
-                        success = rag_system.add_document(file_url, stored_filename)
-                        if success:
-                            logger.info(f"✅ 강제 임베딩 완료: {original_name}")
-                            embedded_count += 1
+        # 파일마다 벡터 저장소를 다시 쓰지 않도록 끝날 때 한 번만 저장
+        with rag_system._batched_save():
+            for file_info in files:
+                try:
+                    file_url = file_info.get('url')
+                    original_name = file_info.get('name')
+                    stored_filename = file_info.get('filename')
+                    has_embedding = file_info.get('has_embedding', False)
+                    
+                    logger.info(f"📄 파일 정보: {original_name} -> {stored_filename} (URL: {file_url}, 임베딩: {has_embedding})")
+                    
+                    if file_url and stored_filename:
+                        if not has_embedding:
+                            logger.info(f"📄 강제 임베딩 시작: {original_name}")
+                            success = rag_system.add_document(file_url, stored_filename)
+                            if success:
+                                logger.info(f"✅ 강제 임베딩 완료: {original_name}")
+                                embedded_count += 1
+                            else:
+                                logger.error(f"❌ 강제 임베딩 실패: {original_name}")
+                                failed_count += 1
                         else:
-                            logger.error(f"❌ 강제 임베딩 실패: {original_name}")
-                            failed_count += 1
+                            logger.info(f"ℹ️ 이미 임베딩된 파일 건너뜀: {original_name}")
                     else:
-                        logger.info(f"ℹ️ 이미 임베딩된 파일 건너뜀: {original_name}")
-                else:
-                    logger.warning(f"⚠️ 파일 정보 불완전: {file_info}")
+                        logger.warning(f"⚠️ 파일 정보 불완전: {file_info}")
+                        failed_count += 1
+                        
+                except Exception as e:
+                    logger.error(f"❌ 강제 임베딩 중 오류: {file_info.get('name', 'unknown')} - {e}")
                     failed_count += 1
-                    
-            except Exception as e:
-                logger.error(f"❌ 강제 임베딩 중 오류: {file_info.get('name', 'unknown')} - {e}")
-                failed_count += 1
-        
+            
         logger.info(f"✅ 강제 동기화 완료: {embedded_count}개 성공, {failed_count}개 실패")
         return jsonify({
             'message': f'강제 동기화가 완료되었습니다. {embedded_count}개 파일 임베딩 성공, {failed_count}개 실패',
@@ -793,7 +1266,7 @@ def debug_files():
         if not storage:
             return jsonify({'error': '스토리지가 초기화되지 않았습니다.'}), 500
         
-        files = storage.list_files()
+        files = cached_list_files()
         debug_info = []
         
         for file_info in files:
@@ -822,25 +1295,16 @@ def debug_files():
 def get_system_status():
     """시스템 상태 정보 반환"""
     try:
-        import psutil
-        import time
+        # CPU 및 메모리 사용량 (백그라운드 측정값)
+        cpu_percent, memory = get_system_stats()
         
-        # CPU 및 메모리 사용량
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        
-        # RAG 시스템 상태
-        rag_status = rag_system.get_status() if rag_system else {}
-        storage_info = storage.get_storage_info() if storage else {}
-        
-        logger.info(f"🔍 시스템 상태 조회: RAG 문서 {rag_status.get('total_documents', 0)}개, 임베딩 {rag_status.get('total_embeddings', 0)}개")
-        
-        # API 응답 속도 측정
+        # RAG 시스템 및 저장소 상태 조회 시간을 API 응답 속도로 사용
         start_time = time.time()
-        # 간단한 테스트 쿼리 실행
-        test_response = "테스트 완료"
+        rag_status, storage_info = gather_status()
         api_response_time = (time.time() - start_time) * 1000  # ms
         
+        logger.info(f"🔍 시스템 상태 조회: RAG 문서 {rag_status.get('total_documents', 0)}개, 임베딩 {rag_status.get('total_embeddings', 0)}개")
+        
         return jsonify({
             'system': {
                 'cpu_percent': cpu_percent,
@@ -867,11 +1331,11 @@ def get_recent_activity():
         activities = []
         
         if os.path.exists(log_file):
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[-100:]  # 최근 100줄
+            lines = tail_lines(log_file, 100)  # 최근 100줄
                 
-            for line in lines:
-                if any(keyword in line.lower() for keyword in ['upload', 'delete', 'embedding', 'query']):
+            for raw_line in lines:
+                if ACTIVITY_PATTERN.search(raw_line):
+                    line = raw_line.decode('utf-8', errors='replace')
                     activities.append({
                         'timestamp': line.split(' - ')[0] if ' - ' in line else '',
                         'message': line.strip()
@@ -1067,9 +1531,9 @@ def get_document_coverage():
         if not storage:
             return jsonify({'error': '스토리지가 초기화되지 않았습니다.'}), 500
         
-        # 새로운 임베딩 통계 메서드 사용
-        embedding_stats = storage.get_embedding_stats()
-        return jsonify({
+        # 새로운 임베딩 통계 메서드 사용 (폴링 대응 TTL 캐시)
+        embedding_stats = cached_call('embedding_stats', storage.get_embedding_stats)
+        return conditional_json({
             'total_documents': embedding_stats.get('total_files', 0),
             'documents_with_embedding': embedding_stats.get('completed_files', 0),
             'documents_without_embedding': embedding_stats.get('pending_files', 0),
@@ -1129,7 +1593,7 @@ def get_settings():
 def clear_chat_history():
     """대화 히스토리 초기화"""
     try:
-        session['chat_history'] = []
+        get_chat_history_buffer().clear()
         return jsonify({'message': '대화 히스토리가 초기화되었습니다.'})
     except Exception as e:
         logger.error(f"대화 히스토리 초기화 중 오류: {e}")
@@ -1140,7 +1604,11 @@ def clear_chat_history():
 def get_chat_history():
     """대화 히스토리 조회"""
     try:
-        chat_history = session.get('chat_history', [])
+        chat_history = [
+            {**conv, 'timestamp': datetime.fromtimestamp(conv['timestamp'] / 1e9).isoformat()}
+            if isinstance(conv.get('timestamp'), int) else conv
+            for conv in get_chat_history_buffer()
+        ]
         return jsonify({
             'chat_history': chat_history,
             'total_count': len(chat_history)
@@ -1151,25 +1619,43 @@ def get_chat_history():
 
 @app.route('/api/status')
 def status():
-    rag_status = rag_system.get_status() if rag_system else {}
-    storage_info = storage.get_storage_info() if storage else {}
-    chat_history_count = len(session.get('chat_history', []))
+    chat_history_count = get_chat_history_count(session.get('sid'))
     
-    return jsonify({
-        'status': 'ok',
-        'rag_system': rag_status,
-        'storage': storage_info,
-        'chat_history_count': chat_history_count,
-        'is_cloud_run': False,
-        'allowed_extensions': list(ALLOWED_EXTENSIONS),
-        'max_file_size_mb': MAX_FILE_SIZE // (1024 * 1024)
-    })
+    # 하위 조회 없이 계산 가능한 변경 표시 값으로 ETag를 만들어, 바뀐 게 없으면 304로 바로 응답
+    # (다른 인스턴스의 변경은 max-age가 지난 뒤 인덱스 generation으로 반영)
+    state = (
+        chat_history_count,
+        storage.get_index_generation() if storage else None,
+        storage.get_cache_version() if storage else None,
+        rag_system.mutation_count if rag_system else None
+    )
+    etag = hashlib.md5(repr(state).encode()).hexdigest()
+    if etag_matches(etag):
+        response = app.response_class(status=304)
+    else:
+        rag_status, storage_info = gather_status()
+        response = jsonify({
+            'status': 'ok',
+            'rag_system': rag_status,
+            'storage': storage_info,
+            'chat_history_count': chat_history_count,
+            'is_cloud_run': False,
+            'allowed_extensions': list(ALLOWED_EXTENSIONS),
+            'max_file_size_mb': MAX_FILE_SIZE // (1024 * 1024)
+        })
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'private, max-age={STATUS_CACHE_TTL}'
+    return response
 
 # 에러 핸들러
 @app.errorhandler(404)
 def not_found_error(error):
     return render_template('error.html', error='페이지를 찾을 수 없습니다.'), 404
 
+@app.errorhandler(413)
+def request_entity_too_large(error):
+    return jsonify({'error': f'요청 크기가 너무 큽니다. 최대 크기: {MAX_REQUEST_SIZE // (1024 * 1024)}MB'}), 413
+
 @app.errorhandler(500)
 def internal_error(error):
     return render_template('error.html', error='서버 내부 오류가 발생했습니다.'), 500
@@ -1,8 +1,10 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
+@lru_cache(maxsize=1)
 def get_config():
-    """환경에 따른 설정 반환 (Cloud 전용)"""
+    """환경에 따른 설정 반환 (Cloud 전용, 프로세스당 한 번만 생성)"""
     environment = os.getenv('ENVIRONMENT', 'cloud')
     
     if environment == 'cloud':
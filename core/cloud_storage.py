@@ -1,113 +1,408 @@
 import os
+import time
 import logging
+import threading
+import queue
+import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
 import json
+import socket
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from google.cloud import storage
-from google.cloud.exceptions import NotFound
+from google.api_core import retry as api_retry
+from google.cloud.exceptions import NotFound, NotModified, PreconditionFailed
+from google.api_core.exceptions import RequestRangeNotSatisfiable
 
 logger = logging.getLogger(__name__)
 
+def _dump_json(obj) -> bytes:
+    """메타데이터 JSON 직렬화 (들여쓰기 없이 UTF-8 bytes)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # ensure_ascii 기본값(True)이 C 인코더의 ASCII 고속 경로를 사용
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _load_json(content):
+    """메타데이터 JSON 역직렬화 (bytes/str 모두 허용)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """TCP keepalive를 켠 HTTPS 연결 풀 (유휴 연결이 중간 장비에서 끊기지 않도록 유지)"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        socket_options = list(HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Linux(Cloud Run)에서는 유휴 60초부터 keepalive 패킷 전송
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 20))
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+        kwargs['socket_options'] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+# 프로젝트별 storage.Client 캐시 (인증/연결 설정을 프로세스당 한 번만 수행)
+_clients: Dict[Optional[str], Any] = {}
+_clients_lock = threading.Lock()
+
+def _get_client(project_id: Optional[str]):
+    """프로젝트의 공유 storage.Client 반환 (없으면 생성)"""
+    with _clients_lock:
+        client = _clients.get(project_id)
+        if client is None:
+            client = storage.Client(project=project_id)
+            # 동시 다운로드/삭제 스레드 수보다 연결 풀이 작으면(기본 10) 연결을 계속 새로 맺으므로 확장
+            # 연결 단계 오류만 여기서 재시도하고 요청/응답 오류는 GCS_RETRY가 처리
+            adapter = _KeepAliveAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5))
+            client._http.mount('https://', adapter)
+            _clients[project_id] = client
+        return client
+
+def _iter_pages_prefetched(blob_iterator):
+    """list_blobs 결과를 순회하면서 다음 페이지를 미리 요청 (페이지 GET 대기와 처리를 겹침)"""
+    pages = blob_iterator.pages
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='gcs-list') as executor:
+        next_page = executor.submit(next, pages, None)
+        while True:
+            page = next_page.result()
+            if page is None:
+                return
+            next_page = executor.submit(next, pages, None)
+            yield from page
+
+# 같은 원본 파일명이 반복 업로드되는 경우가 많아 변환 결과를 캐시
+_secure_filename = lru_cache(maxsize=1024)(secure_filename)
+
+# GCS 요청 재시도 정책 (일시적 오류만, 지수 백오프 + 지터, 최대 30초)
+GCS_RETRY = api_retry.Retry(initial=0.5, maximum=8.0, multiplier=2.0, deadline=30.0, predicate=api_retry.if_transient_error)
+
+# GCS batch 요청 하나에 담을 수 있는 최대 작업 수
+GCS_BATCH_SIZE = 100
+
+# batch 요청을 쓸 수 없을 때 동시에 삭제할 최대 스레드 수
+DELETE_MAX_WORKERS = 16
+
+# 메타데이터 파일을 동시에 다운로드할 최대 스레드 수
+METADATA_MAX_WORKERS = 32
+
+# GCS HTTP 연결 풀 크기 (동시 작업 스레드 수 합보다 크게)
+HTTP_POOL_SIZE = 64
+
+# 모든 파일 메타데이터를 모아 둔 단일 인덱스 (조회 시 GET 한 번)
+METADATA_INDEX_BLOB = "metadata_index.json"
+INDEX_UPDATE_RETRIES = 5
+
+# get_metadata/get_storage_info 결과 캐시 유지 시간 (초)
+STORAGE_CACHE_TTL = 30
+
+# 이 크기보다 큰 파일은 8MB 단위 resumable 업로드 (메모리 사용 제한, 실패 시 이어서 전송)
+# 문서 업로드는 if_generation_match=0(새 객체만 생성)으로 보내 라이브러리가 안전하게 재시도할 수 있게 함
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# open_stream으로 큰 문서를 나눠 읽을 때 구간 요청 하나의 크기
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# 백그라운드 업로드 작업 스레드 수와 완료된 작업 상태 보관 시간 (초)
+UPLOAD_WORKER_THREADS = 4
+UPLOAD_TASK_RETENTION = 60 * 60
+# 대기 중인 백그라운드 업로드 최대 개수 (항목마다 파일 내용 전체를 메모리에 보관하므로 제한)
+UPLOAD_QUEUE_SIZE = int(os.environ.get('UPLOAD_QUEUE_SIZE', '16'))
+
 class CloudStorage:
     """Google Cloud Storage 클래스"""
     
     def __init__(self, bucket_name: str, project_id: str, is_cloud_run: bool = True):
         self.bucket_name = bucket_name
+        self._gs_prefix = f"gs://{bucket_name}/"
         self.project_id = project_id
         self.is_cloud_run = is_cloud_run
         
+        # 메타데이터 인덱스 갱신은 프로세스 안에서 직렬화 (다른 인스턴스와는 generation으로 조정)
+        self._index_lock = threading.Lock()
+        # 잠금을 기다리는 동안 쌓인 갱신은 한 번의 인덱스 저장으로 묶어 처리 (동시 업로드 대응)
+        self._pending_index_updates: List[list] = []
+        self._pending_index_lock = threading.Lock()
+        
+        # 조회 결과 TTL 캐시 (변경 작업 시 버전을 올려 무효화)
+        self._cache: Dict[str, tuple] = {}
+        self._cache_version = 0
+        self._cache_lock = threading.Lock()
+        
+        # 마지막으로 읽거나 쓴 메타데이터 인덱스 (generation, 인덱스)
+        self._index_snapshot: Optional[tuple] = None
+        
+        # 백그라운드 업로드 작업 (task_id -> 상태), 작업 스레드는 처음 요청 시 시작
+        self._upload_queue = queue.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        self._upload_tasks: Dict[str, Dict[str, Any]] = {}
+        self._upload_tasks_lock = threading.Lock()
+        self._upload_workers_started = False
+        
+        # 저장된 파일명 -> list_files() 항목 색인 (list_files 호출 시 갱신)
+        self._files_by_name: Dict[str, Dict[str, Any]] = {}
+        
         # Cloud Storage 클라이언트 초기화 (재시도 로직 포함)
         self.client = None
         self.bucket = None
+        self._bucket_info: Dict[str, Any] = {'name': bucket_name}
         self._initialize_client_with_retry()
     
-    def _initialize_client_with_retry(self, max_retries: int = 3):
-        """재시도 로직을 포함한 클라이언트 초기화"""
-        for attempt in range(max_retries):
+    def _initialize_client_with_retry(self):
+        """재시도 로직을 포함한 클라이언트 초기화 (일시적 오류는 GCS_RETRY 지수 백오프)"""
+        try:
+            logger.info("🔄 Cloud Storage 클라이언트 초기화 시도")
+            
+            # Cloud Storage 클라이언트 초기화 (프로세스 공유 클라이언트 재사용)
+            self.client = _get_client(self.project_id)
+            self.bucket = self.client.bucket(self.bucket_name)
+            
+            # 연결 테스트 겸 버킷 정보 로드 (get_storage_info에서 재사용)
+            # bucket.reload()는 fields를 받지 않으므로 필요한 필드만 요청해 직접 채움
             try:
-                logger.info(f"🔄 Cloud Storage 클라이언트 초기화 시도 {attempt + 1}/{max_retries}")
-                
-                # Cloud Storage 클라이언트 초기화 (기본 방식)
-                self.client = storage.Client(project=self.project_id)
-                self.bucket = self.client.bucket(self.bucket_name)
-                
-                # 연결 테스트 (간단한 버킷 존재 확인)
-                try:
-                    bucket_exists = self.bucket.exists()
-                    logger.info(f"✅ Cloud Storage 초기화 완료: {self.bucket_name} (버킷 존재: {bucket_exists})")
-                    return
-                except Exception as test_error:
-                    logger.warning(f"⚠️ 연결 테스트 실패, 재시도: {test_error}")
-                    raise test_error
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Cloud Storage 초기화 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                
-                if attempt < max_retries - 1:
-                    import time
-                    wait_time = (attempt + 1) * 2  # 2, 4, 6초 대기
-                    logger.info(f"⏳ {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"❌ Cloud Storage 초기화 최종 실패: {e}")
-                    # 초기화 실패해도 클라이언트는 None으로 유지하여 나중에 재시도 가능
-                    self.client = None
-                    self.bucket = None
-                    raise
-    
-    def upload_file(self, file) -> str:
-        """파일을 Cloud Storage에 업로드"""
+                resource = self.client._get_resource(
+                    self.bucket.path,
+                    query_params={'fields': 'name,location,storageClass,timeCreated'},
+                    retry=GCS_RETRY
+                )
+                self.bucket._set_properties(resource)
+                bucket_exists = True
+            except NotFound:
+                bucket_exists = False
+            self._bucket_info = {
+                'name': self.bucket_name,
+                'location': self.bucket.location,
+                'storage_class': self.bucket.storage_class,
+                'created': self.bucket.time_created.isoformat() if self.bucket.time_created else None
+            }
+            logger.info(f"✅ Cloud Storage 초기화 완료: {self.bucket_name} (버킷 존재: {bucket_exists})")
+            
+        except Exception as e:
+            logger.error(f"❌ Cloud Storage 초기화 최종 실패: {e}")
+            # 초기화 실패해도 클라이언트는 None으로 유지하여 나중에 재시도 가능
+            self.client = None
+            self.bucket = None
+            raise
+    
+    def upload_file(self, file, max_size: Optional[int] = None) -> str:
+        """werkzeug FileStorage를 Cloud Storage에 업로드 (max_size를 넘으면 업로드 전에 ValueError)"""
         try:
             # 원본 파일명 저장
             original_filename = file.filename
-            # 안전한 파일명 생성
-            secure_name = secure_filename(original_filename)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            stored_filename = f"{timestamp}_{secure_name}"
+            stored_filename = self._make_stored_filename(original_filename)
+            content_type = file.mimetype or 'application/octet-stream'
             
-            # Cloud Storage에 업로드
-            blob = self.bucket.blob(f"documents/{stored_filename}")
-            blob.upload_from_file(file)
+            size = self._stream_size(file.stream)
+            if size is None:
+                # 크기를 알 수 없는 스트림은 한도 + 1 바이트까지만 읽어 메모리에서 업로드
+                data = file.stream.read(max_size + 1) if max_size is not None else file.stream.read()
+                if max_size is not None and len(data) > max_size:
+                    raise ValueError('too large')
+                self._store_upload_bytes(original_filename, stored_filename, data, content_type)
+            else:
+                if max_size is not None and size > max_size:
+                    raise ValueError('too large')
+                # 크기를 미리 알면 다시 버퍼링하지 않고 스트림을 청크 단위 resumable 업로드로 그대로 전송
+                # (작은 파일은 단일 요청), 문서와 메타데이터는 동시에 업로드
+                chunk_size = UPLOAD_CHUNK_SIZE if size > UPLOAD_CHUNK_SIZE else None
+                blob = self._document_blob(stored_filename, original_filename, chunk_size=chunk_size)
+                self._store_upload(original_filename, stored_filename,
+                                   lambda: blob.upload_from_file(file.stream, size=size, rewind=False,
+                                                                 content_type=content_type, if_generation_match=0),
+                                   size, content_type)
             
-            # 메타데이터 저장
-            metadata = {
-                'original_name': original_filename,
-                'stored_name': stored_filename,
-                'size': blob.size,
-                'uploaded_at': datetime.now().isoformat(),
-                'content_type': blob.content_type,
-                'has_embedding': False,
-                'updated_at': datetime.now().isoformat()
-            }
+            logger.info(f"✅ 파일 업로드 완료: {original_filename} -> {stored_filename}")
+            return f"{self._gs_prefix}documents/{stored_filename}"
             
-            # 메타데이터를 별도 파일로 저장
-            metadata_blob = self.bucket.blob(f"metadata/{stored_filename}.json")
-            metadata_blob.upload_from_string(
-                json.dumps(metadata, ensure_ascii=False, indent=2),
-                content_type='application/json'
-            )
+        except Exception as e:
+            logger.error(f"❌ 파일 업로드 실패: {e}")
+            raise
+    
+    @staticmethod
+    def _stream_size(stream) -> Optional[int]:
+        """탐색 가능한 스트림이면 남은 크기를 계산하고 위치는 그대로 둠"""
+        try:
+            if not stream.seekable():
+                return None
+            position = stream.tell()
+            size = stream.seek(0, os.SEEK_END) - position
+            stream.seek(position)
+            return size
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def upload_bytes(self, original_filename: str, data: bytes, content_type: Optional[str] = None) -> str:
+        """메모리에 읽어 둔 파일 내용을 Cloud Storage에 업로드 (스레드에서 호출 가능)"""
+        try:
+            stored_filename = self._make_stored_filename(original_filename)
+            
+            # Cloud Storage에 업로드 (문서와 메타데이터 동시 업로드)
+            self._store_upload_bytes(original_filename, stored_filename, data, content_type)
             
             logger.info(f"✅ 파일 업로드 완료: {original_filename} -> {stored_filename}")
-            return f"gs://{self.bucket_name}/documents/{stored_filename}"
+            return f"{self._gs_prefix}documents/{stored_filename}"
             
         except Exception as e:
             logger.error(f"❌ 파일 업로드 실패: {e}")
             raise
     
+    def submit_upload(self, original_filename: str, data: bytes, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """업로드를 백그라운드 작업으로 등록하고 바로 반환 (task_id로 진행 상태 조회)
+        
+        대기열이 가득 차 있으면 queue.Full 발생 (호출자가 잠시 후 다시 시도하도록 응답)
+        """
+        self._start_upload_workers()
+        stored_filename = self._make_stored_filename(original_filename)
+        task = {
+            'task_id': uuid.uuid4().hex,
+            'filename': original_filename,
+            'stored_filename': stored_filename,
+            'url': f"{self._gs_prefix}documents/{stored_filename}",
+            'status': 'queued',
+            'error': None,
+            'created_at': time.time()
+        }
+        with self._upload_tasks_lock:
+            self._prune_upload_tasks()
+            self._upload_tasks[task['task_id']] = task
+        try:
+            self._upload_queue.put_nowait((task['task_id'], data, content_type))
+        except queue.Full:
+            with self._upload_tasks_lock:
+                del self._upload_tasks[task['task_id']]
+            logger.warning(f"⚠️ 백그라운드 업로드 대기열이 가득 참: {original_filename}")
+            raise
+        return dict(task)
+    
+    def get_upload_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """백그라운드 업로드 작업 상태 조회"""
+        with self._upload_tasks_lock:
+            task = self._upload_tasks.get(task_id)
+            return dict(task) if task else None
+    
+    def _start_upload_workers(self):
+        """백그라운드 업로드 스레드 시작 (한 번만)"""
+        with self._upload_tasks_lock:
+            if self._upload_workers_started:
+                return
+            self._upload_workers_started = True
+        for i in range(UPLOAD_WORKER_THREADS):
+            threading.Thread(target=self._upload_worker, name=f'gcs-upload-{i}', daemon=True).start()
+    
+    def _prune_upload_tasks(self):
+        """보관 시간이 지난 완료/실패 작업 제거 (_upload_tasks_lock 안에서 호출)"""
+        cutoff = time.time() - UPLOAD_TASK_RETENTION
+        expired = [task_id for task_id, task in self._upload_tasks.items()
+                   if task['status'] in ('done', 'failed') and task['created_at'] < cutoff]
+        for task_id in expired:
+            del self._upload_tasks[task_id]
+    
+    def _set_upload_task(self, task_id: str, **fields):
+        with self._upload_tasks_lock:
+            self._upload_tasks[task_id].update(fields)
+    
+    def _upload_worker(self):
+        """업로드 큐에서 작업을 꺼내 문서와 메타데이터를 동시에 업로드"""
+        while True:
+            task_id, data, content_type = self._upload_queue.get()
+            with self._upload_tasks_lock:
+                task = dict(self._upload_tasks[task_id])
+            self._set_upload_task(task_id, status='uploading')
+            try:
+                self._store_upload_bytes(task['filename'], task['stored_filename'], data, content_type)
+                self._set_upload_task(task_id, status='done')
+                logger.info(f"✅ 백그라운드 업로드 완료: {task['filename']} -> {task['stored_filename']}")
+            except Exception as e:
+                self._set_upload_task(task_id, status='failed', error=str(e))
+                logger.error(f"❌ 백그라운드 업로드 실패: {task['filename']} - {e}")
+            finally:
+                self._upload_queue.task_done()
+    
+    def _store_upload_bytes(self, original_filename: str, stored_filename: str, data: bytes, content_type: Optional[str] = None):
+        """메모리의 파일 내용을 문서와 메타데이터로 동시에 업로드"""
+        content_type = content_type or 'application/octet-stream'
+        # 큰 파일은 청크 단위 resumable 업로드, 작은 파일은 단일 요청
+        chunk_size = UPLOAD_CHUNK_SIZE if len(data) > UPLOAD_CHUNK_SIZE else None
+        blob = self._document_blob(stored_filename, original_filename, chunk_size=chunk_size)
+        self._store_upload(original_filename, stored_filename,
+                           lambda: blob.upload_from_string(data, content_type=content_type, if_generation_match=0),
+                           len(data), content_type)
+    
+    def _store_upload(self, original_filename: str, stored_filename: str, upload_document, size: int, content_type: str):
+        """upload_document()와 메타데이터 업로드를 동시에 실행 (문서 업로드 실패 시 메타데이터 정리)"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            doc_future = executor.submit(upload_document)
+            metadata_future = executor.submit(self._save_upload_metadata, original_filename, stored_filename, size, content_type)
+            try:
+                doc_future.result()
+            except Exception:
+                # 문서 없이 메타데이터만 남지 않도록 이 업로드가 쓴 항목만 정리 (다른 업로드가 쓴 항목은 유지)
+                if metadata_future.exception() is None:
+                    metadata = metadata_future.result()
+                    
+                    def remove_own_metadata(index):
+                        if index.get(stored_filename) == metadata:
+                            del index[stored_filename]
+                    
+                    self._update_index(remove_own_metadata)
+                raise
+            metadata_future.result()
+    
+    def _document_blob(self, stored_filename: str, original_filename: str, chunk_size: Optional[int] = None):
+        """업로드할 문서 blob 생성 (원본 파일명/임베딩 상태를 blob 메타데이터로 함께 저장)"""
+        blob = self.bucket.blob(f"documents/{stored_filename}", chunk_size=chunk_size)
+        # 인덱스를 다시 만들 때 문서 목록 조회 한 번으로 복원할 수 있도록 별도 메타데이터 파일 대신 사용
+        blob.metadata = {'original_name': original_filename, 'has_embedding': 'false'}
+        return blob
+    
+    def _make_stored_filename(self, original_filename: str) -> str:
+        """저장용 파일명 생성 (타임스탬프-고유값_안전한파일명)"""
+        # 안전한 파일명 생성
+        secure_name = _secure_filename(original_filename)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 같은 초에 같은 이름으로 동시에 올려도 이름이 겹치지 않도록 고유값 추가
+        return f"{timestamp}-{uuid.uuid4().hex[:8]}_{secure_name}"
+    
+    def _save_upload_metadata(self, original_filename: str, stored_filename: str, size: Optional[int], content_type: Optional[str]) -> Dict[str, Any]:
+        """업로드된 파일의 메타데이터를 인덱스에 저장하고 반환 (문서 blob 메타데이터에도 같은 정보가 있음)"""
+        # 업로드 시각과 수정 시각이 어긋나지 않도록 시계는 한 번만 읽음
+        now = datetime.now().isoformat()
+        metadata = {
+            'original_name': original_filename,
+            'stored_name': stored_filename,
+            'size': size,
+            'uploaded_at': now,
+            'content_type': content_type,
+            'has_embedding': False,
+            'updated_at': now
+        }
+        self._update_index(lambda index: index.__setitem__(stored_filename, metadata))
+        return metadata
+    
     def download_file(self, file_url: str) -> bytes:
         """Cloud Storage에서 파일 다운로드"""
         try:
             if file_url.startswith('gs://'):
                 # gs://bucket/path 형식에서 경로 추출
-                path = file_url.replace(f"gs://{self.bucket_name}/", "")
+                path = file_url.removeprefix(self._gs_prefix)
                 blob = self.bucket.blob(path)
                 
-                if not blob.exists():
+                # exists() 사전 확인 없이 GET 한 번으로 처리 (없으면 404)
+                try:
+                    content = blob.download_as_bytes(retry=GCS_RETRY)
+                except NotFound:
                     logger.error(f"❌ 파일이 존재하지 않음: {path}")
                     raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
-                
-                content = blob.download_as_bytes()
                 logger.info(f"✅ Cloud Storage에서 파일 다운로드 성공: {len(content)} bytes")
                 return content
             else:
@@ -126,95 +421,263 @@ class CloudStorage:
             logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
             raise
     
+    def download_range(self, file_url: str, start: int, end: int) -> bytes:
+        """파일의 start~end 바이트(end 포함)만 HTTP Range 요청으로 다운로드 (범위가 파일 끝을 넘으면 b'')"""
+        path = file_url.removeprefix(self._gs_prefix)
+        try:
+            return self.bucket.blob(path).download_as_bytes(start=start, end=end, retry=GCS_RETRY)
+        except NotFound:
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+        except RequestRangeNotSatisfiable:
+            return b''
+    
+    def open_stream(self, file_url: str, chunk_size: int = STREAM_CHUNK_SIZE):
+        """파일을 chunk_size 단위 구간 요청으로 순서대로 반환 (처리하는 동안 다음 구간을 미리 받아 둠)"""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='gcs-range') as executor:
+            start = 0
+            next_chunk = executor.submit(self.download_range, file_url, start, start + chunk_size - 1)
+            while True:
+                chunk = next_chunk.result()
+                if not chunk:
+                    return
+                start += len(chunk)
+                if len(chunk) < chunk_size:
+                    yield chunk
+                    return
+                next_chunk = executor.submit(self.download_range, file_url, start, start + chunk_size - 1)
+                yield chunk
+    
+    def _cached(self, key: str, fetch):
+        """fetch() 결과를 STORAGE_CACHE_TTL초 동안 캐시 (오류 응답은 캐시하지 않음)"""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            version = self._cache_version
+        if cached and time.time() - cached[0] < STORAGE_CACHE_TTL:
+            return cached[1]
+        
+        value = fetch()
+        if not (isinstance(value, dict) and 'error' in value):
+            with self._cache_lock:
+                # 조회 도중 변경 작업이 있었으면 오래된 결과이므로 저장하지 않음
+                if version == self._cache_version:
+                    self._cache[key] = (time.time(), value)
+        return value
+    
+    def _invalidate_cache(self):
+        """조회 결과 캐시 무효화"""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._cache.clear()
+    
+    def get_index_generation(self) -> Optional[int]:
+        """마지막으로 읽거나 쓴 메타데이터 인덱스의 generation (요청 없이 반환, ETag 계산용)"""
+        snapshot = self._index_snapshot
+        return snapshot[0] if snapshot else None
+    
+    def get_cache_version(self) -> int:
+        """이 프로세스에서 저장소가 변경될 때마다 증가하는 버전 (ETag 계산용)"""
+        return self._cache_version
+    
     def get_metadata(self) -> Dict[str, Any]:
-        """모든 파일의 메타데이터 조회 (재시도 로직 포함)"""
-        max_retries = 3
-        for attempt in range(max_retries):
+        """모든 파일의 메타데이터 조회 (TTL 캐시)"""
+        return self._cached('metadata', self._fetch_metadata)
+    
+    def _get_stored_by_original(self) -> Dict[str, str]:
+        """원본 파일명 -> 저장된 파일명 역방향 인덱스 (메타데이터 캐시와 함께 무효화)"""
+        return self._cached('stored_by_original', self._build_stored_by_original)
+    
+    def _build_stored_by_original(self) -> Dict[str, str]:
+        """메타데이터에서 역방향 인덱스 구성 (같은 원본 파일명이 여러 개면 먼저 나온 항목 사용)"""
+        stored_by_original = {}
+        for stored_name, file_metadata in self.get_metadata().items():
+            stored_by_original.setdefault(file_metadata.get('original_name'), stored_name)
+        return stored_by_original
+    
+    def _fetch_metadata(self) -> Dict[str, Any]:
+        """모든 파일의 메타데이터 조회 (일시적 오류는 요청 단위로 GCS_RETRY 재시도)"""
+        try:
+            # 클라이언트가 초기화되지 않은 경우 재시도
+            if not self.client or not self.bucket:
+                logger.info("🔄 클라이언트 재초기화 시도")
+                self._initialize_client_with_retry()
+            
+            # 인덱스가 있으면 GET 한 번으로 끝남
+            # (이전에 읽은 generation과 같으면 서버가 본문 없이 304를 돌려주므로 기존 값 재사용)
+            snapshot = self._index_snapshot
             try:
-                # 클라이언트가 초기화되지 않은 경우 재시도
-                if not self.client or not self.bucket:
-                    logger.info(f"🔄 클라이언트 재초기화 시도 {attempt + 1}/{max_retries}")
-                    try:
-                        self._initialize_client_with_retry()
-                    except Exception as init_error:
-                        logger.error(f"❌ 클라이언트 재초기화 실패: {init_error}")
-                        if attempt < max_retries - 1:
-                            continue
-                        else:
-                            return {}
-                
-                metadata = {}
-                blobs = self.bucket.list_blobs(prefix="metadata/")
-                
-                for blob in blobs:
-                    if blob.name.endswith('.json'):
-                        try:
-                            content = blob.download_as_text()
-                            data = json.loads(content)
-                            # 파일명에서 .json 제거
-                            filename = blob.name.replace("metadata/", "").replace(".json", "")
-                            metadata[filename] = data
-                        except Exception as e:
-                            logger.warning(f"⚠️ 메타데이터 로드 실패: {blob.name} - {e}")
-                
-                return metadata
-                
-            except Exception as e:
-                logger.warning(f"⚠️ 메타데이터 조회 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                
-                if attempt < max_retries - 1:
-                    import time
-                    wait_time = (attempt + 1) * 2
-                    logger.info(f"⏳ {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
+                index, _ = self._load_index(snapshot[0] if snapshot else None)
+            except NotModified:
+                return snapshot[1]
+            if index is not None:
+                return index
+            
+            # 인덱스가 없으면 파일별 메타데이터로 만들고 다음 조회부터 인덱스 사용
+            metadata = self._load_metadata_files()
+            try:
+                self._save_index(metadata, 0)
+                logger.info(f"✅ 메타데이터 인덱스 생성: {len(metadata)}개 파일")
+            except PreconditionFailed:
+                pass
+            return metadata
+            
+        except Exception as e:
+            logger.error(f"❌ 메타데이터 조회 최종 실패: {e}")
+            return {}
+    
+    def _load_metadata_files(self) -> Dict[str, Any]:
+        """문서 목록에서 메타데이터를 복원 (인덱스 재구성용)
+        
+        문서 blob 메타데이터에 원본 파일명이 있으면 목록 응답만으로 복원하고,
+        이전 방식으로 업로드된 문서만 metadata/ 아래 파일을 내려받음
+        """
+        metadata = {}
+        blobs = []
+        fields = "items(name,size,metadata,timeCreated,updated,contentType),nextPageToken"
+        for doc_blob in _iter_pages_prefetched(self.bucket.list_blobs(prefix="documents/", fields=fields, retry=GCS_RETRY)):
+            stored_filename = doc_blob.name[len("documents/"):]
+            custom = doc_blob.metadata or {}
+            if 'original_name' in custom:
+                metadata[stored_filename] = {
+                    'original_name': custom['original_name'],
+                    'stored_name': stored_filename,
+                    'size': doc_blob.size,
+                    'uploaded_at': doc_blob.time_created.isoformat() if doc_blob.time_created else '',
+                    'content_type': doc_blob.content_type,
+                    'has_embedding': custom.get('has_embedding') == 'true',
+                    'updated_at': custom.get('updated_at') or (doc_blob.updated.isoformat() if doc_blob.updated else '')
+                }
+            else:
+                blobs.append(self.bucket.blob(f"metadata/{stored_filename}.json"))
+        
+        # 메타데이터 파일 다운로드는 파일마다 GET 요청이므로 동시에 실행
+        if blobs:
+            with ThreadPoolExecutor(max_workers=min(METADATA_MAX_WORKERS, len(blobs))) as executor:
+                for item in executor.map(self._load_metadata_blob, blobs):
+                    if item:
+                        metadata[item[0]] = item[1]
+        return metadata
+    
+    def _load_index(self, known_generation: Optional[int] = None) -> tuple:
+        """메타데이터 인덱스 로드 -> (인덱스, generation), 없으면 (None, None)
+        
+        known_generation과 같은 버전이면 NotModified 발생
+        """
+        blob = self.bucket.blob(METADATA_INDEX_BLOB)
+        try:
+            content = blob.download_as_bytes(if_generation_not_match=known_generation, retry=GCS_RETRY)
+        except NotFound:
+            self._index_snapshot = None
+            return None, None
+        index = _load_json(content)
+        self._index_snapshot = (blob.generation, index) if blob.generation else None
+        return index, blob.generation
+    
+    def _save_index(self, index: Dict[str, Any], generation: int):
+        """메타데이터 인덱스 저장 (generation이 바뀌었으면 PreconditionFailed)"""
+        blob = self.bucket.blob(METADATA_INDEX_BLOB)
+        blob.upload_from_string(
+            _dump_json(index),
+            content_type='application/json',
+            if_generation_match=generation
+        )
+        self._index_snapshot = (blob.generation, index) if blob.generation else None
+    
+    def _update_index(self, mutate):
+        """인덱스를 읽어 mutate(index) 적용 후 저장 (다른 인스턴스와 충돌하면 다시 시도)
+        
+        다른 스레드가 저장하는 동안 들어온 갱신들은 대기열에 모았다가
+        다음 잠금 보유자가 한꺼번에 적용해 인덱스를 한 번만 저장함
+        """
+        update = [mutate, False]  # [mutate, 처리 완료 여부]
+        with self._pending_index_lock:
+            self._pending_index_updates.append(update)
+        try:
+            with self._index_lock:
+                if update[1]:
+                    # 앞선 잠금 보유자가 이미 함께 저장함
+                    return
+                with self._pending_index_lock:
+                    batch, self._pending_index_updates = self._pending_index_updates, []
+                for pending in batch:
+                    pending[1] = True
+                if len(batch) > 1:
+                    logger.info(f"🔄 메타데이터 인덱스 갱신 {len(batch)}건을 한 번에 저장")
+                self._apply_index_updates([pending[0] for pending in batch])
+        finally:
+            # 저장이 끝난 뒤 무효화해야 갱신 도중 읽은 이전 값이 캐시에 남지 않음
+            self._invalidate_cache()
+    
+    def _apply_index_updates(self, mutations):
+        """인덱스에 mutations를 순서대로 적용해 한 번 저장 (self._index_lock 안에서 호출)"""
+        for attempt in range(INDEX_UPDATE_RETRIES):
+            try:
+                # 마지막으로 읽거나 쓴 인덱스를 기준으로 갱신 (다른 인스턴스가 바꿨으면 저장 시 충돌 후 다시 읽음)
+                snapshot = self._index_snapshot if attempt == 0 else None
+                if snapshot:
+                    generation, index = snapshot[0], dict(snapshot[1])
                 else:
-                    logger.error(f"❌ 메타데이터 조회 최종 실패: {e}")
-                    return {}
+                    index, generation = self._load_index()
+                    if index is None:
+                        index, generation = self._load_metadata_files(), 0
+                    else:
+                        index = dict(index)
+                for mutate in mutations:
+                    mutate(index)
+                self._save_index(index, generation)
+                return
+            except PreconditionFailed:
+                logger.info(f"🔄 메타데이터 인덱스 충돌, 재시도 {attempt + 1}/{INDEX_UPDATE_RETRIES}")
+            except Exception as e:
+                logger.error(f"❌ 메타데이터 인덱스 갱신 실패: {e}")
+                return
+        logger.error("❌ 메타데이터 인덱스 갱신 최종 실패")
+    
+    def _load_metadata_blob(self, blob) -> Optional[tuple]:
+        """메타데이터 blob 하나 다운로드 -> (파일명, 메타데이터), 실패 시 None"""
+        try:
+            data = _load_json(blob.download_as_bytes(retry=GCS_RETRY))
+            # 파일명에서 .json 제거
+            filename = blob.name.replace("metadata/", "").replace(".json", "")
+            return filename, data
+        except Exception as e:
+            logger.warning(f"⚠️ 메타데이터 로드 실패: {blob.name} - {e}")
+            return None
     
     def mark_embedding_status(self, filename: str, has_embedding: bool):
         """임베딩 상태 업데이트"""
         try:
-            # 먼저 원본 파일명으로 메타데이터 찾기
             metadata = self.get_metadata()
-            target_metadata_blob = None
-            found_filename = None
-            
-            # 원본 파일명으로 찾기
-            for stored_filename, file_metadata in metadata.items():
-                if file_metadata.get('original_name') == filename:
-                    target_metadata_blob = self.bucket.blob(f"metadata/{stored_filename}.json")
-                    found_filename = stored_filename
-                    break
             
-            # 원본 파일명으로 찾지 못한 경우, 저장된 파일명으로 시도
-            if not target_metadata_blob:
-                # 저장된 파일명으로 직접 시도
-                if filename in metadata:
-                    target_metadata_blob = self.bucket.blob(f"metadata/{filename}.json")
-                    found_filename = filename
-                else:
+            # 호출부는 대부분 저장된 파일명을 넘기므로 먼저 그대로 확인 (빠른 경로)
+            if filename in metadata:
+                found_filename = filename
+            else:
+                # 원본 파일명으로 찾기 (역방향 인덱스로 O(1) 조회)
+                found_filename = self._get_stored_by_original().get(filename)
+                
+                if not found_filename:
                     # 확장자 제거하고 시도
                     filename_without_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
-                    for stored_filename, file_metadata in metadata.items():
-                        if stored_filename == filename or stored_filename.startswith(filename_without_ext):
-                            target_metadata_blob = self.bucket.blob(f"metadata/{stored_filename}.json")
+                    for stored_filename in metadata:
+                        if stored_filename.startswith(filename_without_ext):
                             found_filename = stored_filename
                             break
             
-            if target_metadata_blob and target_metadata_blob.exists():
-                # 기존 메타데이터 로드
-                content = target_metadata_blob.download_as_text()
-                metadata_data = json.loads(content)
-                
+            if found_filename in metadata:
                 # 임베딩 상태 업데이트
+                metadata_data = dict(metadata[found_filename])
                 metadata_data['has_embedding'] = has_embedding
                 metadata_data['updated_at'] = datetime.now().isoformat()
                 
-                # 업데이트된 메타데이터 저장
-                target_metadata_blob.upload_from_string(
-                    json.dumps(metadata_data, ensure_ascii=False, indent=2),
-                    content_type='application/json'
-                )
+                # 문서 blob 메타데이터만 PATCH (이전 방식 문서도 원본 파일명을 함께 옮겨 둠)
+                doc_blob = self.bucket.blob(f"documents/{found_filename}")
+                doc_blob.metadata = {
+                    'original_name': metadata_data.get('original_name', found_filename),
+                    'has_embedding': 'true' if has_embedding else 'false',
+                    'updated_at': metadata_data['updated_at']
+                }
+                doc_blob.patch(retry=GCS_RETRY)
+                self._update_index(lambda index: index.__setitem__(found_filename, metadata_data))
                 
                 logger.info(f"✅ 임베딩 상태 업데이트: {filename} -> {has_embedding} (메타데이터: {found_filename})")
             else:
@@ -231,35 +694,18 @@ class CloudStorage:
         """파일 삭제"""
         try:
             # 먼저 메타데이터에서 실제 저장된 파일명 찾기
-            metadata = self.get_metadata()
-            stored_filename = None
-            
-            # 원본 파일명으로 찾기
-            for stored_name, file_metadata in metadata.items():
-                if file_metadata.get('original_name') == filename:
-                    stored_filename = stored_name
-                    break
+            stored_filename = self._get_stored_by_original().get(filename)
             
             # 원본 파일명으로 찾지 못한 경우, 저장된 파일명으로 시도
             if not stored_filename:
                 stored_filename = filename
             
-            # 문서 파일 삭제
-            doc_blob = self.bucket.blob(f"documents/{stored_filename}")
-            if doc_blob.exists():
-                doc_blob.delete()
-                logger.info(f"✅ 문서 파일 삭제: {stored_filename}")
-            else:
-                logger.warning(f"⚠️ 문서 파일을 찾을 수 없음: {stored_filename}")
-            
-            # 메타데이터 파일 삭제
-            metadata_blob = self.bucket.blob(f"metadata/{stored_filename}.json")
-            if metadata_blob.exists():
-                metadata_blob.delete()
-                logger.info(f"✅ 메타데이터 파일 삭제: {stored_filename}.json")
-            else:
-                logger.warning(f"⚠️ 메타데이터 파일을 찾을 수 없음: {stored_filename}.json")
+            # 문서 파일과 메타데이터 파일을 동시에 삭제 (exists() 사전 확인 없이 NotFound로 판별)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(self._delete_blob_if_exists, [f"documents/{stored_filename}", f"metadata/{stored_filename}.json"]))
             
+            self._update_index(lambda index: index.pop(stored_filename, None))
+            self._files_by_name.pop(stored_filename, None)
             logger.info(f"✅ 파일 삭제 완료: {filename} (저장된 파일명: {stored_filename})")
             return True
             
@@ -283,12 +729,13 @@ class CloudStorage:
                     'created': file_metadata.get('uploaded_at', ''),
                     'updated': file_metadata.get('updated_at', file_metadata.get('uploaded_at', '')),
                     'has_embedding': file_metadata.get('has_embedding', False),
-                    'url': f"gs://{self.bucket_name}/documents/{filename}",
+                    'url': f"{self._gs_prefix}documents/{filename}",
                     'content_type': file_metadata.get('content_type', '')
                 })
             
             # 업로드 시간순으로 정렬
             files.sort(key=lambda x: x.get('uploaded_at', ''), reverse=True)
+            self._files_by_name = {f['filename']: f for f in files}
             
             logger.info(f"✅ 파일 목록 조회 완료: {len(files)}개 파일")
             return files
@@ -297,35 +744,124 @@ class CloudStorage:
             logger.error(f"❌ 파일 목록 조회 실패: {e}")
             return []
     
+    def get_file_info(self, filename: str) -> Optional[Dict[str, Any]]:
+        """저장된 파일명으로 파일 정보 조회 (색인에 없으면 목록을 한 번 새로 읽음)"""
+        file_info = self._files_by_name.get(filename)
+        if file_info is None:
+            self.list_files()
+            file_info = self._files_by_name.get(filename)
+        return file_info
+    
+    def _delete_blob_if_exists(self, blob_name: str) -> bool:
+        """blob 하나 삭제 (없으면 경고만 남기고 False)"""
+        try:
+            self.bucket.delete_blob(blob_name)
+            logger.info(f"✅ 파일 삭제: {blob_name}")
+            return True
+        except NotFound:
+            logger.warning(f"⚠️ 파일을 찾을 수 없음: {blob_name}")
+            return False
+    
+    def _try_delete_blob(self, blob_name: str) -> bool:
+        """blob 하나 삭제 (이미 없으면 성공으로 간주, 그 밖의 오류는 False)"""
+        try:
+            self._delete_blob_if_exists(blob_name)
+            return True
+        except Exception as e:
+            logger.error(f"❌ 파일 삭제 실패: {blob_name} - {e}")
+            return False
+    
+    def _delete_blobs_parallel(self, blob_names: List[str]) -> Dict[str, bool]:
+        """batch 요청을 쓸 수 없을 때 스레드 풀로 blob들을 동시에 삭제 -> blob별 성공 여부"""
+        with ThreadPoolExecutor(max_workers=DELETE_MAX_WORKERS) as executor:
+            return dict(zip(blob_names, executor.map(self._try_delete_blob, blob_names)))
+    
+    def _delete_blobs_batched(self, blob_names: List[str], best_effort: bool = False) -> Dict[str, bool]:
+        """blob들을 GCS batch 요청(최대 100개씩)으로 삭제 -> blob별 성공 여부 (이미 없는 blob은 성공)
+        
+        best_effort=True면 실패한 묶음을 개별 삭제로 다시 확인하지 않고 결과에서 제외
+        """
+        results = {}
+        for start in range(0, len(blob_names), GCS_BATCH_SIZE):
+            chunk = blob_names[start:start + GCS_BATCH_SIZE]
+            try:
+                with self.client.batch():
+                    for blob_name in chunk:
+                        self.bucket.delete_blob(blob_name)
+                results.update(dict.fromkeys(chunk, True))
+            except Exception as e:
+                if best_effort:
+                    logger.info(f"ℹ️ batch 삭제 일부 실패 무시 (batch {start // GCS_BATCH_SIZE + 1}): {e}")
+                    continue
+                # batch 응답은 첫 번째 오류만 알려 주므로 이 묶음은 개별 삭제로 blob별 결과를 확인
+                logger.warning(f"⚠️ batch 삭제 일부 실패, 개별 삭제로 확인 (batch {start // GCS_BATCH_SIZE + 1}): {e}")
+                results.update(self._delete_blobs_parallel(chunk))
+        return results
+    
     def delete_multiple_files(self, filenames: List[str]) -> Dict[str, bool]:
-        """여러 파일 일괄 삭제"""
+        """여러 파일 일괄 삭제 (batch 요청 사용)"""
         results = {}
-        for filename in filenames:
-            results[filename] = self.delete_file(filename)
+        try:
+            # 원본 파일명 -> 저장된 파일명 매핑은 한 번만 구성
+            stored_by_original = self._get_stored_by_original()
+        except Exception as e:
+            logger.error(f"❌ 메타데이터 조회 실패: {e}")
+            stored_by_original = {}
+        
+        stored_names = {filename: stored_by_original.get(filename, filename) for filename in filenames}
+        
+        # 파일별 결과는 문서 삭제 결과로 판단 (문서끼리 batch로 묶어야 다른 파일의 오류에 가려지지 않음)
+        doc_results = self._delete_blobs_batched([f"documents/{stored}" for stored in stored_names.values()])
+        for filename, stored_filename in stored_names.items():
+            results[filename] = doc_results.get(f"documents/{stored_filename}", False)
+            if results[filename]:
+                self._files_by_name.pop(stored_filename, None)
+        
+        # 이전 방식으로 업로드된 파일의 메타데이터 파일 정리 (대부분 없으므로 결과는 무시)
+        self._delete_blobs_batched([f"metadata/{stored_names[filename]}.json" for filename, ok in results.items() if ok],
+                                   best_effort=True)
+        
+        # 인덱스는 마지막에 한 번만 갱신
+        deleted = {stored_names[filename] for filename, ok in results.items() if ok}
+        if deleted:
+            def remove_deleted(index):
+                for stored_filename in deleted:
+                    index.pop(stored_filename, None)
+            self._update_index(remove_deleted)
+        
+        logger.info(f"✅ 일괄 삭제 완료: {sum(results.values())}/{len(filenames)}개 파일")
         return results
     
     def delete_all_files(self) -> bool:
         """모든 파일 삭제"""
         try:
-            # 문서 파일들 삭제
-            doc_blobs = list(self.bucket.list_blobs(prefix="documents/"))
-            for blob in doc_blobs:
-                blob.delete()
+            # 문서 파일들과 메타데이터 파일들을 batch 요청으로 삭제
+            # 삭제에는 이름만 필요하므로 필드를 제한해 목록 응답 크기를 줄임
+            # 두 접두사를 match_glob으로 묶어 목록 조회 한 번으로 처리
+            doc_names = []
+            metadata_names = []
+            for blob in _iter_pages_prefetched(self.bucket.list_blobs(match_glob="{documents/**,metadata/**}",
+                                                                      fields="items(name),nextPageToken", retry=GCS_RETRY)):
+                (doc_names if blob.name.startswith("documents/") else metadata_names).append(blob.name)
+            success = all(self._delete_blobs_batched(doc_names + metadata_names + [METADATA_INDEX_BLOB]).values())
+            self._files_by_name = {}
+            self._index_snapshot = None
+            self._invalidate_cache()
             
-            # 메타데이터 파일들 삭제
-            metadata_blobs = list(self.bucket.list_blobs(prefix="metadata/"))
-            for blob in metadata_blobs:
-                blob.delete()
-            
-            logger.info(f"✅ 모든 파일 삭제 완료: {len(doc_blobs)}개 문서, {len(metadata_blobs)}개 메타데이터")
-            return True
+            if success:
+                logger.info(f"✅ 모든 파일 삭제 완료: {len(doc_names)}개 문서, {len(metadata_names)}개 메타데이터")
+            return success
             
         except Exception as e:
             logger.error(f"❌ 전체 파일 삭제 실패: {e}")
             return False
     
     def get_embedding_stats(self) -> Dict[str, Any]:
-        """임베딩 통계 조회"""
+        """임베딩 통계 조회 (TTL 캐시, 메타데이터 인덱스 한 번으로 집계)"""
+        return self._cached('embedding_stats', self._compute_embedding_stats)
+    
+    def _compute_embedding_stats(self) -> Dict[str, Any]:
+        """임베딩 통계 계산"""
         try:
             metadata = self.get_metadata()
             total_files = len(metadata)
@@ -350,62 +886,49 @@ class CloudStorage:
             }
     
     def get_storage_info(self) -> Dict[str, Any]:
-        """저장소 정보 조회 (재시도 로직 포함)"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # 클라이언트가 초기화되지 않은 경우 재시도
-                if not self.client or not self.bucket:
-                    logger.info(f"🔄 클라이언트 재초기화 시도 {attempt + 1}/{max_retries}")
-                    try:
-                        self._initialize_client_with_retry()
-                    except Exception as init_error:
-                        logger.error(f"❌ 클라이언트 재초기화 실패: {init_error}")
-                        if attempt < max_retries - 1:
-                            continue
-                        else:
-                            return {
-                                'type': 'cloud_storage',
-                                'error': f'클라이언트 초기화 실패: {init_error}',
-                                'bucket_name': self.bucket_name,
-                                'project_id': self.project_id
-                            }
-                
-                # 버킷 정보
-                bucket_info = {
-                    'name': self.bucket_name,
-                    'location': self.bucket.location,
-                    'storage_class': self.bucket.storage_class,
-                    'created': self.bucket.time_created.isoformat() if self.bucket.time_created else None
-                }
-                
-                # 파일 통계
-                doc_blobs = list(self.bucket.list_blobs(prefix="documents/"))
-                metadata_blobs = list(self.bucket.list_blobs(prefix="metadata/"))
-                
-                total_size = sum(blob.size for blob in doc_blobs if blob.size)
-                
-                return {
-                    'type': 'cloud_storage',
-                    'bucket_info': bucket_info,
-                    'total_files': len(doc_blobs),
-                    'total_size': total_size,
-                    'metadata_files': len(metadata_blobs)
-                }
-                
-            except Exception as e:
-                logger.warning(f"⚠️ 저장소 정보 조회 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                
-                if attempt < max_retries - 1:
-                    import time
-                    wait_time = (attempt + 1) * 2
-                    logger.info(f"⏳ {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"❌ 저장소 정보 조회 최종 실패: {e}")
+        """저장소 정보 조회 (TTL 캐시)"""
+        return self._cached('storage_info', self._fetch_storage_info)
+    
+    def _fetch_storage_info(self) -> Dict[str, Any]:
+        """저장소 정보 조회 (일시적 오류는 요청 단위로 GCS_RETRY 재시도)"""
+        try:
+            # 클라이언트가 초기화되지 않은 경우 재시도
+            if not self.client or not self.bucket:
+                logger.info("🔄 클라이언트 재초기화 시도")
+                try:
+                    self._initialize_client_with_retry()
+                except Exception as init_error:
                     return {
                         'type': 'cloud_storage',
-                        'error': str(e),
+                        'error': f'클라이언트 초기화 실패: {init_error}',
                         'bucket_name': self.bucket_name,
                         'project_id': self.project_id
                     }
+            
+            # 버킷 정보 (초기화 시 한 번 로드한 값)
+            bucket_info = self._bucket_info
+            
+            # 파일 통계 (documents/ 아래만, 이름/크기 필드만 받아 집계)
+            total_files = 0
+            total_size = 0
+            for blob in _iter_pages_prefetched(self.bucket.list_blobs(prefix="documents/", fields="items(name,size),nextPageToken", retry=GCS_RETRY)):
+                total_files += 1
+                total_size += blob.size or 0
+            
+            return {
+                'type': 'cloud_storage',
+                'bucket_info': bucket_info,
+                'total_files': total_files,
+                'total_size': total_size,
+                'metadata_files': len(self.get_metadata())
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ 저장소 정보 조회 최종 실패: {e}")
+            return {
+                'type': 'cloud_storage',
+                'error': str(e),
+                'bucket_name': self.bucket_name,
+                'project_id': self.project_id
+            }
+    
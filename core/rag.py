@@ -1,17 +1,74 @@
 import os
-import tempfile
+import io
+import re
 import logging
 import time
+import threading
+import uuid
+import queue
+import bisect
+import heapq
+import hashlib
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 import openai
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
 import pickle
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
+from google.cloud.exceptions import NotFound
+
+# 벡터 저장소 blob 경로 (문서 목록은 JSON, 임베딩은 float16 .npy로 분리 저장)
+# 임베딩은 저장할 때마다 새 이름(embeddings-<uuid>.npy)으로 올리고 문서 목록이 그 이름을 가리킴
+VECTOR_DOCUMENTS_BLOB = "vector_store/documents.json"
+VECTOR_EMBEDDINGS_PREFIX = "vector_store/embeddings"
+VECTOR_EMBEDDINGS_BLOB = "vector_store/embeddings.npy"  # 고정 이름을 쓰던 이전 저장 형식
+LEGACY_VECTOR_STORE_BLOB = "vector_store/vector_store.pkl"
+
+# 조항 패턴 (제N조/항/호/목 또는 N조/항/호/목) - 모듈 로드 시 한 번만 컴파일
+_ARTICLE_RE = re.compile(r'(제?)(\d+[조항호목])')
+_ARTICLE_CHAR_RE = re.compile(r'[조항호목]')
+_DIGITS_RE = re.compile(r'\d+')
+
+# 질문 유형 판별용 키워드 (목록별로 하나의 패턴으로 컴파일해 질문을 한 번만 탐색)
+_FILENAME_QUESTION_KEYWORDS = [
+    '파일명', '문서명', '저장하고 있는', '업로드된', '문서가 뭐',
+    '저장되어 있는', '문서 목록', '목록', '리스트', '어떤 문서',
+    '무슨 문서', '문서들', '파일들', '업로드한', '등록된'
+]
+_CONTEXT_QUESTION_KEYWORDS = ['관련', '조항', '내용', '그것', '이것', '해당', '위에서', '앞서']
+_ARTICLE_QUESTION_KEYWORDS = ['조', '항', '호', '목', '몇', '조항', '규정', '내용']
+_FILENAME_QUESTION_RE = re.compile('|'.join(map(re.escape, _FILENAME_QUESTION_KEYWORDS)))
+_CONTEXT_QUESTION_RE = re.compile('|'.join(map(re.escape, _CONTEXT_QUESTION_KEYWORDS)))
+_ARTICLE_QUESTION_RE = re.compile('|'.join(map(re.escape, _ARTICLE_QUESTION_KEYWORDS)))
+
+# 키워드 추출 시 제외할 한국어 불용어
+_STOPWORDS = frozenset(['은', '는', '이', '가', '을', '를', '에', '의', '로', '으로', '에서', '에게', '와', '과', '도', '만', '부터', '까지', '한', '두', '세', '네', '다섯', '여섯', '일곱', '여덟', '아홉', '열'])
 
 logger = logging.getLogger(__name__)
 
+def _dump_json(obj) -> bytes:
+    """벡터 저장소 문서 목록 JSON 직렬화 (UTF-8 bytes)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _load_json(content):
+    """벡터 저장소 문서 목록 JSON 역직렬화 (bytes/str 모두 허용)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 class RAGSystem:
     """향상된 RAG 시스템 - OpenAI API 직접 사용"""
     
@@ -28,12 +85,72 @@ class RAGSystem:
         # API 호출 속도 제한
         self.last_api_call_time = 0
         self.api_call_interval = 0.1  # 100ms 간격
+        self._rate_limit_lock = threading.Lock()
+        
+        # documents/embeddings/vector_store 동시 수정 방지 (병렬 임베딩 대응)
+        self._lock = threading.RLock()
+        
+        # 임베딩 배치 크기 (OpenAI 요청당 최대 2048개 입력, 청크당 최대 8000자라 분당 토큰 한도 고려)
+        self.embedding_batch_size = 96
+        # 여러 문서를 추가할 때 동시에 보낼 임베딩 요청 수 (속도 제한 간격은 그대로 적용)
+        self.embedding_concurrency = 4
+        
+        # 같은 질문을 다시 받으면 OpenAI 호출 없이 재사용 (키: (임베딩 모델, 질문))
+        self._query_embedding_cache = lru_cache(maxsize=1024)(self._embed_query_uncached)
+        
+        # 의미가 거의 같은 질문의 답변 재사용 (이전 대화 맥락 없이 답한 경우만, 문서가 바뀌면 비움)
+        # 항목: (정규화된 질문 임베딩, 질문 속 숫자, LLM 모델, 답변, 저장 시각)
+        self._answer_cache = deque(maxlen=256)
+        self._answer_cache_lock = threading.Lock()
+        self.answer_cache_threshold = 0.97
+        self.answer_cache_ttl = 3600  # 초
+        
+        # 이전 대화의 (키워드 집합, 조항 표기 수)는 매 질문마다 같으므로 재사용 (키: (질문, 답변))
+        self._conversation_features = lru_cache(maxsize=2048)(self._extract_conversation_features)
+        
+        # 같은 청크 텍스트(머리말, 목차 등)는 다시 임베딩하지 않음 (키: (임베딩 모델, 텍스트 해시))
+        # 값은 float32 배열로 따로 보관하고 전체 크기로 제한 (청크가 제거되면 해당 키도 삭제)
+        self._chunk_embedding_cache = {}
+        self._chunk_embedding_cache_bytes = 0
+        self._chunk_embedding_cache_lock = threading.Lock()
+        self.chunk_embedding_cache_max_bytes = 256 * 1024 * 1024
+        
+        # 검색용 캐시 (문서/임베딩이 바뀌면 None으로 비우고 다음 검색에서 다시 구성)
+        # - 행을 단위 벡터로 정규화한 float32 (N, D) 임베딩 행렬
+        # - 파일명 -> 정렬된 (chunk_id, 전체 인덱스) 목록
+        self._emb_matrix = None
+        self._chunks_by_filename = None
+        
+        # 문서/임베딩이 바뀔 때마다 증가 (상태 API의 ETag 계산용)
+        self.mutation_count = 0
+        
+        # HTTP 연결 재사용 (문서 다운로드용 세션, OpenAI API용 httpx 클라이언트는 처음 호출 시 생성)
+        self._http = requests.Session()
+        self._http.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        self._http.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        self._openai_http_client = None
+        self._openai_http_client_lock = threading.Lock()
+        
+        # 일괄 저장 (_batched_save 블록 안의 저장 요청은 모아서 블록 종료 시 한 번만 저장)
+        # 블록을 연 스레드의 저장만 보류하도록 중첩 깊이와 보류 여부는 스레드별로 보관
+        self._save_deferral = threading.local()
+        
+        # 벡터 저장소 파일 정보 캐시 (관리자 대시보드 폴링 대응)
+        self._vector_file_info_cache = None  # (조회 시각, 존재 여부, 크기)
+        
+        # 저장소 로드 성공 전에는 저장하지 않음 (빈 메모리 상태로 기존 인덱스를 덮어쓰지 않도록)
+        self._vector_store_loaded = False
+        # 현재 저장된 벡터 저장소를 이루는 임베딩 blob 이름 (새로 저장한 뒤 삭제 대상)
+        self._persisted_vector_blobs = []
+        self.vector_file_info_ttl = 30  # 초
+        
+        # OpenAI API 키 (로드 중 자동 임베딩에서도 사용하므로 먼저 읽음)
+        self.openai_api_key = os.getenv('OPENAI_API_KEY')
         
         # 기존 벡터 저장소 로드 (API 키와 무관하게 로드)
         self._load_vector_store()
         
         # OpenAI API 키 설정
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
         if not self.openai_api_key:
             logger.warning("⚠️ OPENAI_API_KEY가 설정되지 않았습니다. 질의응답 기능은 사용할 수 없습니다.")
         else:
@@ -52,74 +169,53 @@ class RAGSystem:
     def _validate_openai_api_key(self):
         """OpenAI API 키 유효성 검증"""
         try:
-            import httpx
-            import os
-            import json
-            
-            # 프록시 관련 환경 변수 완전 제거
-            old_proxy_vars = {}
-            proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy']
-            for var in proxy_vars:
-                if var in os.environ:
-                    old_proxy_vars[var] = os.environ[var]
-                    del os.environ[var]
+            # 공유 클라이언트 재사용 (연결 풀 유지, 프록시 환경 변수 무시)
+            http_client = self._get_openai_http_client()
             
-            try:
-                # httpx 클라이언트 생성 (프록시 인수 제거)
-                try:
-                    # httpx 버전에 따라 proxies 인수 지원 여부 확인
-                    http_client = httpx.Client(
-                        timeout=10.0,
-                        limits=httpx.Limits(max_keepalive_connections=2, max_connections=5)
-                    )
-                except TypeError as e:
-                    if "proxies" in str(e):
-                        # proxies 인수가 지원되지 않는 경우 기본 클라이언트 사용
-                        http_client = httpx.Client(
-                            timeout=10.0
-                        )
-                    else:
-                        raise e
-                
-                # OpenAI API 직접 호출로 키 유효성 검증
-                headers = {
-                    "Authorization": f"Bearer {self.openai_api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                response = http_client.get(
-                    "https://api.openai.com/v1/models",
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    logger.info("✅ OpenAI API 키 유효성 검증 완료")
-                else:
-                    raise Exception(f"API 키 검증 실패: {response.status_code} - {response.text}")
-                
-            finally:
-                # 환경 변수 복원
-                for var, value in old_proxy_vars.items():
-                    os.environ[var] = value
-                # HTTP 클라이언트 정리
-                if 'http_client' in locals():
-                    http_client.close()
-                    
+            # OpenAI API 직접 호출로 키 유효성 검증
+            headers = {
+                "Authorization": f"Bearer {self.openai_api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            response = http_client.get(
+                "https://api.openai.com/v1/models",
+                headers=headers,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                logger.info("✅ OpenAI API 키 유효성 검증 완료")
+            else:
+                raise Exception(f"API 키 검증 실패: {response.status_code} - {response.text}")
         except Exception as e:
             logger.error(f"❌ OpenAI API 키 유효성 검증 실패: {e}")
             logger.warning("⚠️ OpenAI API 키가 유효하지 않거나 네트워크 문제가 있을 수 있습니다.")
     
+    def _get_openai_http_client(self) -> httpx.Client:
+        """OpenAI API 호출용 공유 httpx 클라이언트 (스레드 간 공유, 프록시 환경 변수는 사용하지 않음)"""
+        if self._openai_http_client is None:
+            with self._openai_http_client_lock:
+                if self._openai_http_client is None:
+                    self._openai_http_client = httpx.Client(
+                        timeout=30.0,
+                        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                        trust_env=False
+                    )
+        return self._openai_http_client
+    
     def _rate_limit_api_call(self):
-        """API 호출 속도 제한"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_api_call_time
-        
-        if time_since_last_call < self.api_call_interval:
-            sleep_time = self.api_call_interval - time_since_last_call
-            logger.debug(f"⏳ API 호출 속도 제한: {sleep_time:.3f}초 대기")
-            time.sleep(sleep_time)
-        
-        self.last_api_call_time = time.time()
+        """API 호출 속도 제한 (스레드 간 공유)"""
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last_call = current_time - self.last_api_call_time
+            
+            if time_since_last_call < self.api_call_interval:
+                sleep_time = self.api_call_interval - time_since_last_call
+                logger.debug(f"⏳ API 호출 속도 제한: {sleep_time:.3f}초 대기")
+                time.sleep(sleep_time)
+            
+            self.last_api_call_time = time.time()
     
     def _load_vector_store(self):
         """벡터 저장소 로드 (재시도 로직 포함)"""
@@ -142,13 +238,12 @@ class RAGSystem:
                                     else:
                                         return
                             
-                            vector_blob = self.storage.bucket.blob("vector_store/vector_store.pkl")
-                            if vector_blob.exists():
-                                vector_data = vector_blob.download_as_bytes()
-                                data = pickle.loads(vector_data)
-                                self.documents = data.get('documents', [])
-                                self.embeddings = data.get('embeddings', [])
-                                self.vector_store = data.get('vector_store', {})
+                            loaded = self._download_vector_store()
+                            self._vector_store_loaded = True
+                            if loaded is not None:
+                                self.documents, self.embeddings, self.vector_store = loaded
+                                self._invalidate_search_caches()
+                                self._cache_chunk_embeddings([doc.get('content', '') for doc in self.documents], self.embeddings)
                                 embedding_dim = len(self.embeddings[0]) if self.embeddings else 0
                                 logger.info(f"✅ Cloud Storage에서 벡터 저장소 로드 완료: {len(self.documents)}개 문서, {len(self.embeddings)}개 임베딩 (차원: {embedding_dim})")
                                 logger.info(f"🔍 로드된 문서 목록: {[doc.get('filename', 'unknown') for doc in self.documents[:5]]}")
@@ -162,30 +257,31 @@ class RAGSystem:
                                     if len(self.documents) == 0 or len(self.documents) < len(files):
                                         logger.info("🔍 벡터 저장소가 비어있거나 불완전합니다. 기존 파일들을 확인합니다...")
                                         try:
+                                            # 임베딩이 없는 파일만 모아 배치로 추가 (벡터 저장소 저장은 마지막에 한 번)
+                                            pending_files = []
+                                            # 이미 벡터 저장소에 청크가 있는 파일은 has_embedding 표시와 무관하게 건너뜀
+                                            indexed_filenames = {doc.get('stored_filename') for doc in self.documents}
                                             for file_info in files:
-                                                try:
-                                                    file_url = file_info.get('url')
-                                                    original_name = file_info.get('name')  # 원본 파일명
-                                                    stored_filename = file_info.get('filename')  # 저장된 파일명
-                                                    has_embedding = file_info.get('has_embedding', False)
-                                                    
-                                                    if file_url and stored_filename:
-                                                        # 임베딩이 없는 파일만 처리
-                                                        if not has_embedding:
-                                                            logger.info(f"📄 자동 임베딩 시작: {original_name} (저장된 파일명: {stored_filename})")
-                                                            success = self.add_document(file_url, stored_filename)
-                                                            if success:
-                                                                logger.info(f"✅ 자동 임베딩 완료: {original_name}")
-                                                            else:
-                                                                logger.error(f"❌ 자동 임베딩 실패: {original_name}")
-                                                        else:
-                                                            logger.info(f"ℹ️ 이미 임베딩된 파일 건너뜀: {original_name}")
+                                                file_url = file_info.get('url')
+                                                original_name = file_info.get('name')  # 원본 파일명
+                                                stored_filename = file_info.get('filename')  # 저장된 파일명
+                                                if not (file_url and stored_filename):
+                                                    logger.warning(f"⚠️ 파일 정보 불완전: {file_info}")
+                                                elif file_info.get('has_embedding', False) or stored_filename in indexed_filenames:
+                                                    logger.info(f"ℹ️ 이미 임베딩된 파일 건너뜀: {original_name}")
+                                                else:
+                                                    logger.info(f"📄 자동 임베딩 대상: {original_name} (저장된 파일명: {stored_filename})")
+                                                    pending_files.append((file_url, stored_filename))
+                                            
+                                            if pending_files:
+                                                def on_document_done(stored_filename, success):
+                                                    if success:
+                                                        self.storage.mark_embedding_status(stored_filename, True)
+                                                        logger.info(f"✅ 자동 임베딩 완료: {stored_filename}")
                                                     else:
-                                                        logger.warning(f"⚠️ 파일 정보 불완전: {file_info}")
-                                                except Exception as e:
-                                                    logger.error(f"❌ 자동 임베딩 중 오류: {file_info.get('name', 'unknown')} - {e}")
-                                                    import traceback
-                                                    logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
+                                                        logger.error(f"❌ 자동 임베딩 실패: {stored_filename}")
+                                                
+                                                self.add_documents_batch(pending_files, on_document_done=on_document_done)
                                         except Exception as e:
                                             logger.error(f"❌ 기존 파일 확인 중 오류: {e}")
                                     else:
@@ -195,12 +291,11 @@ class RAGSystem:
                         except Exception as e:
                             logger.warning(f"⚠️ Cloud Storage 벡터 저장소 로드 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                             if attempt < max_retries - 1:
-                                import time
                                 wait_time = (attempt + 1) * 2
                                 logger.info(f"⏳ {wait_time}초 후 재시도...")
                                 time.sleep(wait_time)
-                            else:
-                                logger.error(f"❌ Cloud Storage 벡터 저장소 로드 최종 실패: {e}")
+                                continue
+                            logger.error(f"❌ Cloud Storage 벡터 저장소 로드 최종 실패 (로드 전까지 저장하지 않음): {e}")
                     else:
                         logger.error("❌ Cloud Storage가 초기화되지 않았습니다")
                 else:
@@ -210,7 +305,6 @@ class RAGSystem:
             except Exception as e:
                 logger.warning(f"⚠️ 벡터 저장소 로드 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    import time
                     wait_time = (attempt + 1) * 2
                     logger.info(f"⏳ {wait_time}초 후 재시도...")
                     time.sleep(wait_time)
@@ -221,6 +315,11 @@ class RAGSystem:
     
     def _remove_existing_document(self, filename: str):
         """기존 문서가 있다면 제거 (중복 방지)"""
+        with self._lock:
+            self._remove_existing_document_unlocked(filename)
+    
+    def _remove_existing_document_unlocked(self, filename: str):
+        """기존 문서 제거 (호출자가 self._lock 보유)"""
         try:
             # 같은 파일명의 문서들을 찾아서 제거
             indices_to_remove = []
@@ -240,29 +339,26 @@ class RAGSystem:
             if indices_to_remove:
                 logger.info(f"🗑️ 기존 문서 제거: {filename} ({len(indices_to_remove)}개 청크)")
                 
-                # 역순으로 제거 (인덱스가 변경되지 않도록)
-                for i in reversed(indices_to_remove):
-                    # vector_store에서도 제거
+                # vector_store에서도 제거 (여러 가능한 vector_key 패턴 시도)
+                for i in indices_to_remove:
                     doc = self.documents[i]
                     chunk_id = doc.get('chunk_id', i)
-                    doc_filename = doc.get('filename', '')
-                    doc_stored_filename = doc.get('stored_filename', '')
-                    
-                    # 여러 가능한 vector_key 패턴 시도
                     possible_keys = [
-                        f"{doc_filename}_{chunk_id}",
-                        f"{doc_stored_filename}_{chunk_id}",
+                        f"{doc.get('filename', '')}_{chunk_id}",
+                        f"{doc.get('stored_filename', '')}_{chunk_id}",
                         f"{filename}_{chunk_id}"
                     ]
-                    
                     for vector_key in possible_keys:
-                        if vector_key in self.vector_store:
-                            del self.vector_store[vector_key]
+                        if self.vector_store.pop(vector_key, None) is not None:
                             logger.info(f"🗑️ 벡터 키 제거: {vector_key}")
-                    
-                    # documents와 embeddings에서 제거
-                    del self.documents[i]
-                    del self.embeddings[i]
+                
+                # documents와 embeddings는 남길 항목만 한 번에 다시 구성 (청크마다 del로 리스트를 당기지 않음)
+                remove_set = set(indices_to_remove)
+                removed_docs = [self.documents[i] for i in indices_to_remove]
+                self.documents = [doc for i, doc in enumerate(self.documents) if i not in remove_set]
+                self.embeddings = [embedding for i, embedding in enumerate(self.embeddings) if i not in remove_set]
+                self._invalidate_search_caches()
+                self._forget_chunk_embeddings([removed.get('content', '') for removed in removed_docs])
                 
                 logger.info(f"✅ 기존 문서 제거 완료: {filename} ({len(indices_to_remove)}개 청크)")
             else:
@@ -272,8 +368,34 @@ class RAGSystem:
             import traceback
             logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
     
+    @contextmanager
+    def _batched_save(self):
+        """블록 안에서 이 스레드가 요청한 벡터 저장소 저장을 모아 블록이 끝날 때 한 번만 저장 (중첩 가능)"""
+        deferral = self._save_deferral
+        deferral.depth = getattr(deferral, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            deferral.depth -= 1
+            flush = deferral.depth == 0 and getattr(deferral, 'pending', False)
+            if flush:
+                deferral.pending = False
+                logger.info("💾 보류된 벡터 저장소 저장 실행")
+                self._save_vector_store()
+    
     def _save_vector_store(self):
         """벡터 저장소 저장 (재시도 로직 포함)"""
+        deferral = self._save_deferral
+        if getattr(deferral, 'depth', 0):
+            deferral.pending = True
+            logger.info("ℹ️ 일괄 저장 중이므로 벡터 저장소 저장 보류")
+            return True
+        
+        # 기존 저장소를 읽지 못한 상태에서 저장하면 메모리에 있는 문서만으로 덮어쓰게 되므로 먼저 다시 읽어 합침
+        if self.storage and not self._vector_store_loaded and not self._recover_vector_store():
+            logger.error("❌ 기존 벡터 저장소를 읽지 못해 저장하지 않음 (덮어쓰기 방지)")
+            return False
+        
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -281,51 +403,29 @@ class RAGSystem:
                     logger.error("❌ 스토리지가 초기화되지 않았습니다")
                     return False
                 
-                data = {
-                    'documents': self.documents,
-                    'embeddings': self.embeddings,
-                    'vector_store': self.vector_store,
-                    'saved_at': datetime.now().isoformat(),
-                    'total_documents': len(self.documents),
-                    'total_embeddings': len(self.embeddings)
-                }
+                # 다른 스레드가 수정 중인 상태가 저장되지 않도록 잠금 상태에서 직렬화
+                with self._lock:
+                    # 임베딩은 float16 .npy로 저장 (pickle 없이 헤더 + 원시 버퍼만 기록)
+                    # vector_store는 documents와 임베딩으로 다시 만들 수 있으므로 저장하지 않음
+                    buffer = io.BytesIO()
+                    np.save(buffer, np.asarray(self.embeddings, dtype=np.float16), allow_pickle=False)
+                    vector_data = buffer.getvalue()
+                    documents_meta = {
+                        'documents': self.documents,
+                        'embedding_format': 'float16-npy',
+                        'saved_at': datetime.now().isoformat(),
+                        'total_documents': len(self.documents),
+                        'total_embeddings': len(self.embeddings)
+                    }
+                
                 
                 logger.info(f"🔍 벡터 저장소 저장 시작 (시도 {attempt + 1}/{max_retries}): 문서 {len(self.documents)}개, 임베딩 {len(self.embeddings)}개")
                 
                 # Cloud Storage 전용
                 if hasattr(self.storage, 'bucket'):
                     try:
-                        vector_blob = self.storage.bucket.blob("vector_store/vector_store.pkl")
-                        vector_data = pickle.dumps(data)
-                        vector_blob.upload_from_string(vector_data, content_type='application/octet-stream')
-                        logger.info(f"✅ Cloud Storage에 벡터 저장소 저장 완료: {len(vector_data)} bytes")
-                        
-                        # 저장 후 확인 (재시도)
-                        for verify_attempt in range(3):
-                            if vector_blob.exists():
-                                # 파일 크기 확인
-                                actual_size = vector_blob.size
-                                if actual_size == len(vector_data):
-                                    # 추가 검증: 저장된 데이터 로드하여 무결성 확인
-                                    try:
-                                        downloaded_data = vector_blob.download_as_bytes()
-                                        if len(downloaded_data) == len(vector_data):
-                                            logger.info(f"✅ 벡터 저장소 파일 저장 및 검증 완료: {actual_size} bytes")
-                                            logger.info(f"🔍 저장된 문서 수: {len(self.documents)}개, 임베딩 수: {len(self.embeddings)}개")
-                                            return True
-                                        else:
-                                            logger.error(f"❌ 다운로드된 데이터 크기 불일치: 예상 {len(vector_data)} bytes, 실제 {len(downloaded_data)} bytes")
-                                    except Exception as verify_error:
-                                        logger.error(f"❌ 저장된 데이터 검증 실패: {verify_error}")
-                                else:
-                                    logger.warning(f"⚠️ 파일 크기 불일치: 예상 {len(vector_data)} bytes, 실제 {actual_size} bytes")
-                            else:
-                                logger.warning(f"⚠️ 벡터 저장소 파일 존재하지 않음 (확인 시도 {verify_attempt + 1}/3)")
-                            
-                            if verify_attempt < 2:
-                                import time
-                                time.sleep(1)  # 1초 대기 후 재확인
-                        
+                        if self._commit_vector_store(vector_data, documents_meta):
+                            return True
                         logger.error("❌ 벡터 저장소 파일 저장 후 검증 실패")
                         if attempt < max_retries - 1:
                             continue
@@ -335,7 +435,6 @@ class RAGSystem:
                     except Exception as e:
                         logger.warning(f"⚠️ Cloud Storage 벡터 저장소 저장 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                         if attempt < max_retries - 1:
-                            import time
                             wait_time = (attempt + 1) * 2
                             logger.info(f"⏳ {wait_time}초 후 재시도...")
                             time.sleep(wait_time)
@@ -351,7 +450,6 @@ class RAGSystem:
             except Exception as e:
                 logger.warning(f"⚠️ 벡터 저장소 저장 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    import time
                     wait_time = (attempt + 1) * 2
                     logger.info(f"⏳ {wait_time}초 후 재시도...")
                     time.sleep(wait_time)
@@ -363,17 +461,101 @@ class RAGSystem:
         
         return False
     
+    def _commit_vector_store(self, vector_data: bytes, documents_meta: Dict[str, Any]) -> bool:
+        """임베딩을 새 이름으로 올려 검증한 뒤 문서 목록을 저장하고, 그 다음에 이전 임베딩 blob 삭제
+        
+        문서 목록이 저장되기 전에는 기존 파일을 건드리지 않으므로 중간에 실패해도 이전 저장 상태가 그대로 남음
+        """
+        bucket = self.storage.bucket
+        vector_blob_name = f"{VECTOR_EMBEDDINGS_PREFIX}-{uuid.uuid4().hex}.npy"
+        vector_blob = bucket.blob(vector_blob_name)
+        committed = False
+        try:
+            vector_blob.upload_from_string(vector_data, content_type='application/octet-stream', if_generation_match=0)
+            
+            # 문서 목록을 바꾸기 전에 올린 임베딩 확인 (크기는 업로드 응답으로 이미 채워져 있음)
+            if vector_blob.size != len(vector_data):
+                logger.warning(f"⚠️ 파일 크기 불일치: 예상 {len(vector_data)} bytes, 실제 {vector_blob.size} bytes")
+                return False
+            downloaded_data = vector_blob.download_as_bytes()
+            if len(downloaded_data) != len(vector_data):
+                logger.error(f"❌ 다운로드된 데이터 크기 불일치: 예상 {len(vector_data)} bytes, 실제 {len(downloaded_data)} bytes")
+                return False
+            
+            documents_meta['embeddings_blob'] = vector_blob_name
+            documents_blob = bucket.blob(VECTOR_DOCUMENTS_BLOB)
+            documents_blob.upload_from_string(_dump_json(documents_meta), content_type='application/json')
+            committed = True
+        finally:
+            if not committed:
+                # 문서 목록이 가리키지 않는 임베딩 blob은 남기지 않음
+                try:
+                    vector_blob.delete()
+                except Exception:
+                    pass
+        
+        logger.info(f"✅ Cloud Storage에 벡터 저장소 저장 완료: 임베딩 {len(vector_data)} bytes ({vector_blob_name}), 문서 {documents_blob.size} bytes")
+        
+        # 문서 목록이 새 임베딩을 가리킨 뒤에 이전 저장 파일 정리 (이전 pickle 형식 포함)
+        previous_blobs, self._persisted_vector_blobs = self._persisted_vector_blobs, [vector_blob_name]
+        for blob_name in previous_blobs:
+            try:
+                bucket.blob(blob_name).delete()
+                logger.info(f"🗑️ 이전 벡터 저장소 파일 삭제: {blob_name}")
+            except NotFound:
+                pass
+            except Exception as e:
+                logger.warning(f"⚠️ 이전 벡터 저장소 파일 삭제 실패 (무시): {blob_name} - {e}")
+        
+        self._vector_file_info_cache = (time.time(), True, len(vector_data) + (documents_blob.size or 0))
+        logger.info(f"🔍 저장된 문서 수: {documents_meta['total_documents']}개, 임베딩 수: {documents_meta['total_embeddings']}개")
+        return True
+    
+    def _recover_vector_store(self) -> bool:
+        """시작 시 로드에 실패한 경우 저장 전에 기존 저장소를 다시 읽어 메모리의 문서와 합침
+        
+        메모리에 있는 파일의 청크가 우선이고, 저장소에만 있는 파일의 청크는 앞에 다시 붙임
+        """
+        try:
+            loaded = self._download_vector_store()
+        except Exception as e:
+            logger.error(f"❌ 기존 벡터 저장소 다시 읽기 실패: {e}")
+            return False
+        
+        if loaded is not None:
+            documents, embeddings, _ = loaded
+            with self._lock:
+                current_files = {doc.get('stored_filename') or doc.get('filename') for doc in self.documents}
+                kept = [(doc, embedding) for doc, embedding in zip(documents, embeddings)
+                        if (doc.get('stored_filename') or doc.get('filename')) not in current_files]
+                self.documents = [doc for doc, _ in kept] + self.documents
+                self.embeddings = [embedding for _, embedding in kept] + self.embeddings
+                self.vector_store = {
+                    f"{doc['filename']}_{doc['chunk_id']}": embedding
+                    for doc, embedding in zip(self.documents, self.embeddings)
+                }
+                self._invalidate_search_caches()
+            logger.info(f"✅ 기존 벡터 저장소 다시 읽어 합침: 저장소의 {len(kept)}개 청크 유지")
+        
+        self._vector_store_loaded = True
+        return True
+    
     def _delete_vector_store(self):
         """벡터 저장소 파일 삭제 (Cloud Storage 전용)"""
+        self._vector_file_info_cache = None
         try:
             if self.storage and hasattr(self.storage, 'bucket'):
-                # Cloud Storage에서 벡터 저장소 파일 삭제
-                vector_blob = self.storage.bucket.blob('vector_store/vector_store.pkl')
-                if vector_blob.exists():
-                    vector_blob.delete()
-                    logger.info("✅ Cloud Storage에서 벡터 저장소 파일 삭제 완료")
-                else:
-                    logger.info("ℹ️ Cloud Storage에 벡터 저장소 파일이 존재하지 않음")
+                # Cloud Storage에서 벡터 저장소 파일 삭제 (문서 목록 먼저, 모든 임베딩 blob과 이전 pickle 형식 포함)
+                embedding_blobs = [blob.name for blob in self.storage.bucket.list_blobs(prefix=VECTOR_EMBEDDINGS_PREFIX, fields="items(name),nextPageToken")]
+                for blob_name in [VECTOR_DOCUMENTS_BLOB, LEGACY_VECTOR_STORE_BLOB] + embedding_blobs:
+                    try:
+                        self.storage.bucket.blob(blob_name).delete()
+                        logger.info(f"✅ Cloud Storage에서 벡터 저장소 파일 삭제 완료: {blob_name}")
+                    except NotFound:
+                        logger.info(f"ℹ️ Cloud Storage에 벡터 저장소 파일이 존재하지 않음: {blob_name}")
+                # 저장소가 메모리와 같이 비었으므로 이후 저장은 그대로 진행
+                self._persisted_vector_blobs = []
+                self._vector_store_loaded = True
             else:
                 logger.error("❌ Cloud Storage가 초기화되지 않았습니다")
         except Exception as e:
@@ -383,106 +565,165 @@ class RAGSystem:
     
     def _get_embedding(self, text: str) -> List[float]:
         """텍스트 임베딩 생성"""
+        if not text or not text.strip():
+            logger.warning("⚠️ 빈 텍스트로 임베딩 생성 시도")
+            return []
+        
+        embeddings = self._get_embeddings_batch([text])
+        return embeddings[0] if embeddings else []
+    
+    def _get_query_embedding(self, text: str) -> List[float]:
+        """질문 임베딩 생성 (LRU 캐시 사용, 공백만 다른 질문은 같은 키로 취급)"""
+        key = ' '.join(text.split())
+        if not key:
+            return []
         try:
-            logger.info("🔍 _get_embedding 메서드 시작 - 새로운 코드 경로")
-            
-            if not text or not text.strip():
-                logger.warning("⚠️ 빈 텍스트로 임베딩 생성 시도")
+            return list(self._query_embedding_cache(self.embedding_model, key))
+        except ValueError:
+            return []
+    
+    def _embed_query_uncached(self, model: str, text: str) -> tuple:
+        """캐시 미스 시 질문 임베딩 생성 (실패는 예외로 알려 캐시에 남지 않게 함)"""
+        embedding = self._get_embedding(text)
+        if not embedding:
+            raise ValueError("질문 임베딩 생성 실패")
+        return tuple(embedding)
+    
+    def _get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트의 임베딩을 한 번의 API 호출로 생성 (입력 순서 유지, 실패 시 빈 리스트)"""
+        try:
+            if not texts:
                 return []
             
             # API 호출 속도 제한
             self._rate_limit_api_call()
             
             # 텍스트 길이 제한 (OpenAI API 제한)
-            if len(text) > 8000:  # 안전 마진을 두고 8000자로 제한
-                text = text[:8000]
-                logger.warning(f"⚠️ 텍스트가 너무 길어서 8000자로 자름")
+            inputs = []
+            for text in texts:
+                if len(text) > 8000:  # 안전 마진을 두고 8000자로 제한
+                    text = text[:8000]
+                    logger.warning(f"⚠️ 텍스트가 너무 길어서 8000자로 자름")
+                inputs.append(text)
             
             # OpenAI API 직접 호출 (httpx 사용)
-            logger.info("🔍 OpenAI API 직접 호출 시작 - httpx 사용")
             try:
-                import httpx
-                import os
-                import json
-                logger.info("🔍 httpx 모듈 import 완료")
+                # 공유 클라이언트 재사용 (연결 풀 유지, 프록시 환경 변수 무시)
+                http_client = self._get_openai_http_client()
                 
-                # 프록시 관련 환경 변수 완전 제거
-                old_proxy_vars = {}
-                proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy']
-                for var in proxy_vars:
-                    if var in os.environ:
-                        old_proxy_vars[var] = os.environ[var]
-                        del os.environ[var]
-                logger.info("🔍 프록시 환경 변수 제거 완료")
+                # OpenAI API 직접 호출
+                headers = {
+                    "Authorization": f"Bearer {self.openai_api_key}",
+                    "Content-Type": "application/json"
+                }
                 
-                try:
-                    # httpx 클라이언트 생성 (프록시 인수 제거)
-                    try:
-                        # httpx 버전에 따라 proxies 인수 지원 여부 확인
-                        http_client = httpx.Client(
-                            timeout=30.0,
-                            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-                        )
-                        logger.info("🔍 httpx 클라이언트 생성 완료 (limits 포함)")
-                    except TypeError as e:
-                        if "proxies" in str(e):
-                            # proxies 인수가 지원되지 않는 경우 기본 클라이언트 사용
-                            http_client = httpx.Client(
-                                timeout=30.0
-                            )
-                            logger.info("🔍 httpx 클라이언트 생성 완료 (기본 설정)")
-                        else:
-                            raise e
-                    
-                    # OpenAI API 직접 호출
-                    headers = {
-                        "Authorization": f"Bearer {self.openai_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                    
-                    data = {
-                        "model": self.embedding_model,
-                        "input": text
-                    }
-                    
-                    logger.info(f"🔍 OpenAI API 호출 시작: {self.embedding_model}")
-                    response = http_client.post(
-                        "https://api.openai.com/v1/embeddings",
-                        headers=headers,
-                        json=data
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        embedding = result['data'][0]['embedding']
-                        logger.info("🔍 OpenAI API 호출 성공")
-                    else:
-                        raise Exception(f"OpenAI API 오류: {response.status_code} - {response.text}")
-                    
-                finally:
-                    # 환경 변수 복원
-                    for var, value in old_proxy_vars.items():
-                        os.environ[var] = value
-                    # HTTP 클라이언트 정리
-                    if 'http_client' in locals():
-                        http_client.close()
-                        
+                data = {
+                    "model": self.embedding_model,
+                    "input": inputs
+                }
+                
+                logger.info(f"🔍 OpenAI API 호출 시작: {self.embedding_model} ({len(inputs)}개 입력)")
+                response = http_client.post(
+                    "https://api.openai.com/v1/embeddings",
+                    headers=headers,
+                    json=data
+                )
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    # 응답 순서가 보장되지 않으므로 index 기준으로 정렬
+                    items = sorted(result['data'], key=lambda item: item['index'])
+                    embeddings = [item['embedding'] for item in items]
+                else:
+                    raise Exception(f"OpenAI API 오류: {response.status_code} - {response.text}")
             except Exception as client_error:
                 logger.error(f"❌ OpenAI API 호출 실패: {client_error}")
                 raise Exception(f"OpenAI API 호출 실패: {client_error}")
             
-            if embedding and len(embedding) > 0:
-                logger.info(f"✅ 임베딩 생성 성공: {len(embedding)}차원 (모델: {self.embedding_model})")
-                return embedding
-            else:
-                logger.error("❌ 임베딩이 비어있음")
-                return []
+            if len(embeddings) != len(inputs):
+                logger.error(f"❌ 임베딩 개수 불일치: 요청 {len(inputs)}개, 응답 {len(embeddings)}개")
+                return [[] for _ in inputs]
+            
+            logger.info(f"✅ 임베딩 생성 성공: {len(embeddings)}개 ({len(embeddings[0]) if embeddings else 0}차원, 모델: {self.embedding_model})")
+            return embeddings
                 
         except Exception as e:
             logger.error(f"❌ 임베딩 생성 실패: {e}")
             import traceback
             logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
-            return []
+            return [[] for _ in texts]
+    
+    def _get_embeddings_in_batches(self, texts: List[str]) -> List[List[float]]:
+        """텍스트를 embedding_batch_size개씩 나눠 배치 임베딩 (입력 순서 유지, 실패한 항목은 빈 리스트)"""
+        embeddings = []
+        for start in range(0, len(texts), self.embedding_batch_size):
+            embeddings.extend(self._get_chunk_embeddings(texts[start:start + self.embedding_batch_size]))
+        return embeddings
+    
+    def _chunk_cache_key(self, text: str) -> tuple:
+        """청크 임베딩 캐시 키 (임베딩 모델, 텍스트 해시)"""
+        return self.embedding_model, hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_chunk_embeddings(self, texts, embeddings):
+        """청크 임베딩을 float32로 캐시에 저장 (빈 임베딩 제외, 크기 한도를 넘으면 오래된 항목부터 제거)"""
+        with self._chunk_embedding_cache_lock:
+            cache = self._chunk_embedding_cache
+            for text, embedding in zip(texts, embeddings):
+                if len(embedding):
+                    key = self._chunk_cache_key(text)
+                    previous = cache.pop(key, None)
+                    if previous is not None:
+                        self._chunk_embedding_cache_bytes -= previous.nbytes
+                    cache[key] = np.asarray(embedding, dtype=np.float32)
+                    self._chunk_embedding_cache_bytes += cache[key].nbytes
+            while cache and self._chunk_embedding_cache_bytes > self.chunk_embedding_cache_max_bytes:
+                self._chunk_embedding_cache_bytes -= cache.pop(next(iter(cache))).nbytes
+    
+    def _forget_chunk_embeddings(self, texts):
+        """제거된 청크의 임베딩을 캐시에서 삭제"""
+        keys = [self._chunk_cache_key(text) for text in texts]
+        with self._chunk_embedding_cache_lock:
+            for key in keys:
+                removed = self._chunk_embedding_cache.pop(key, None)
+                if removed is not None:
+                    self._chunk_embedding_cache_bytes -= removed.nbytes
+    
+    def _clear_chunk_embedding_cache(self):
+        """청크 임베딩 캐시 전체 삭제"""
+        with self._chunk_embedding_cache_lock:
+            self._chunk_embedding_cache.clear()
+            self._chunk_embedding_cache_bytes = 0
+    
+    def clear_memory(self):
+        """메모리의 문서/임베딩과 관련 캐시 초기화 (저장된 벡터 저장소는 건드리지 않음)"""
+        with self._lock:
+            self.documents = []
+            self.embeddings = []
+            self.vector_store = {}
+            self._invalidate_search_caches()
+            self._clear_chunk_embedding_cache()
+    
+    def _get_chunk_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """청크 임베딩 생성 (캐시에 있거나 배치 안에서 중복된 텍스트는 API로 보내지 않음, 입력 순서 유지)"""
+        keys = [self._chunk_cache_key(text) for text in texts]
+        with self._chunk_embedding_cache_lock:
+            cached = [self._chunk_embedding_cache.get(key) for key in keys]
+        embeddings = [embedding.tolist() if embedding is not None else None for embedding in cached]
+        
+        # 캐시 미스 텍스트만 중복 없이 모아 요청
+        miss_positions = {}
+        for i, (key, embedding) in enumerate(zip(keys, embeddings)):
+            if embedding is None:
+                miss_positions.setdefault(key, []).append(i)
+        if miss_positions:
+            miss_texts = [texts[positions[0]] for positions in miss_positions.values()]
+            logger.info(f"🔍 청크 임베딩 캐시: {len(texts) - sum(len(p) for p in miss_positions.values())}개 재사용, {len(miss_texts)}개 요청")
+            miss_embeddings = self._get_embeddings_batch(miss_texts)
+            self._cache_chunk_embeddings(miss_texts, miss_embeddings)
+            for positions, embedding in zip(miss_positions.values(), miss_embeddings):
+                for i in positions:
+                    embeddings[i] = embedding
+        return embeddings
     
     def _split_text(self, text: str) -> List[str]:
         """텍스트를 청크로 분할 (안전한 버전)"""
@@ -498,23 +739,7 @@ class RAGSystem:
             if len(text) <= self.chunk_size:
                 return [text]
             
-            chunks = []
-            start = 0
-            
-            while start < len(text):
-                end = start + self.chunk_size
-                chunk = text[start:end]
-                
-                # 청크가 비어있지 않은 경우만 추가
-                if chunk.strip():
-                    chunks.append(chunk)
-                
-                start = end - self.chunk_overlap
-                if start >= len(text):
-                    break
-                    
-            # 빈 청크 제거
-            chunks = [chunk for chunk in chunks if chunk.strip()]
+            chunks = list(self._iter_chunks(text))
             
             logger.info(f"📝 텍스트 분할 완료: {len(chunks)}개 청크 (원본 길이: {len(text)}자)")
             return chunks
@@ -529,15 +754,75 @@ class RAGSystem:
             except:
                 return [text] if text.strip() else []
     
-    def add_document(self, file_url: str, filename: str) -> bool:
-        """문서 추가"""
+    def _iter_chunks(self, text: str):
+        """청크를 순서대로 생성 (시작 위치는 chunk_size - chunk_overlap 간격, 빈 청크는 건너뜀)"""
+        # overlap이 chunk_size 이상으로 설정되어도 무한 반복하지 않도록 최소 1칸씩 전진
+        step = max(1, self.chunk_size - self.chunk_overlap)
+        for start in range(0, len(text), step):
+            chunk = text[start:start + self.chunk_size]
+            if chunk.strip():
+                yield chunk
+    
+    def _resolve_document_names(self, file_url: str, filename: str, metadata: Optional[Dict[str, Any]] = None) -> tuple:
+        """file_url에서 (저장된 파일명, 표시용 파일명) 추출 (metadata를 넘기면 재조회 생략)"""
+        # file_url에서 실제 저장된 파일명 추출
+        if file_url.startswith('local://'):
+            stored_filename = file_url.removeprefix('local://')
+        elif file_url.startswith('gs://'):
+            # gs://bucket/path 형식에서 파일명 추출
+            stored_filename = file_url.split('/')[-1]
+        else:
+            stored_filename = filename
+        
+        # 파일명에서 실제 파일명 추출 (메타데이터에서 원본명 가져오기)
+        actual_filename = stored_filename
+        try:
+            # 메타데이터에서 원본 파일명 가져오기
+            if self.storage:
+                if metadata is None:
+                    metadata = self.storage.get_metadata()
+                if stored_filename in metadata and 'original_name' in metadata[stored_filename]:
+                    original_name = metadata[stored_filename]['original_name']
+                    # 확장자 제거
+                    if '.' in original_name:
+                        actual_filename = original_name.rsplit('.', 1)[0]
+                    else:
+                        actual_filename = original_name
+                    logger.info(f"📄 원본 파일명 사용: {actual_filename}")
+                else:
+                    # 메타데이터가 없으면 저장된 파일명에서 타임스탬프 제거 후 확장자 제거
+                    if '_' in stored_filename:
+                        # 타임스탬프_파일명 형식에서 파일명 부분만 추출
+                        parts = stored_filename.split('_', 1)
+                        if len(parts) > 1:
+                            actual_filename = parts[1]
+                    else:
+                        actual_filename = stored_filename
+                    
+                    # 확장자 제거
+                    if '.' in actual_filename:
+                        actual_filename = actual_filename.rsplit('.', 1)[0]
+                    logger.info(f"📄 저장된 파일명 사용 (타임스탬프 및 확장자 제거): {actual_filename}")
+        except Exception as e:
+            logger.warning(f"⚠️ 파일명 추출 실패, 원본 사용: {e}")
+            actual_filename = stored_filename
+            # 타임스탬프 제거 시도
+            if '_' in actual_filename:
+                parts = actual_filename.split('_', 1)
+                if len(parts) > 1:
+                    actual_filename = parts[1]
+            # 확장자 제거
+            if '.' in actual_filename:
+                actual_filename = actual_filename.rsplit('.', 1)[0]
+        
+        return stored_filename, actual_filename
+    
+    def add_document(self, file_url: str, filename: str, save: bool = True) -> bool:
+        """문서 추가 (save=False면 벡터 저장소 저장은 호출자가 마지막에 한 번 수행)"""
         try:
             logger.info(f"🔍 문서 추가 시작: {filename} (URL: {file_url})")
             logger.info(f"🔍 현재 상태: 문서 {len(self.documents)}개, 임베딩 {len(self.embeddings)}개")
             
-            # 기존에 같은 파일이 임베딩되어 있다면 제거
-            self._remove_existing_document(filename)
-            
             if not self.storage:
                 logger.error("❌ 스토리지가 초기화되지 않았습니다")
                 return False
@@ -547,61 +832,11 @@ class RAGSystem:
                 logger.error("❌ OpenAI API 키가 설정되지 않았습니다")
                 return False
             
-            # file_url에서 실제 저장된 파일명 추출
-            if file_url.startswith('local://'):
-                stored_filename = file_url.replace('local://', '')
-            elif file_url.startswith('gs://'):
-                # gs://bucket/path 형식에서 파일명 추출
-                stored_filename = file_url.split('/')[-1]
-            else:
-                stored_filename = filename
-            
-            # 파일명에서 실제 파일명 추출 (메타데이터에서 원본명 가져오기)
-            actual_filename = stored_filename
-            try:
-                # 메타데이터에서 원본 파일명 가져오기
-                if self.storage:
-                    metadata = self.storage.get_metadata()
-                    if stored_filename in metadata and 'original_name' in metadata[stored_filename]:
-                        original_name = metadata[stored_filename]['original_name']
-                        # 확장자 제거
-                        if '.' in original_name:
-                            actual_filename = original_name.rsplit('.', 1)[0]
-                        else:
-                            actual_filename = original_name
-                        logger.info(f"📄 원본 파일명 사용: {actual_filename}")
-                    else:
-                        # 메타데이터가 없으면 저장된 파일명에서 타임스탬프 제거 후 확장자 제거
-                        if '_' in stored_filename:
-                            # 타임스탬프_파일명 형식에서 파일명 부분만 추출
-                            parts = stored_filename.split('_', 1)
-                            if len(parts) > 1:
-                                actual_filename = parts[1]
-                        else:
-                            actual_filename = stored_filename
-                        
-                        # 확장자 제거
-                        if '.' in actual_filename:
-                            actual_filename = actual_filename.rsplit('.', 1)[0]
-                        logger.info(f"📄 저장된 파일명 사용 (타임스탬프 및 확장자 제거): {actual_filename}")
-            except Exception as e:
-                logger.warning(f"⚠️ 파일명 추출 실패, 원본 사용: {e}")
-                actual_filename = stored_filename
-                # 타임스탬프 제거 시도
-                if '_' in actual_filename:
-                    parts = actual_filename.split('_', 1)
-                    if len(parts) > 1:
-                        actual_filename = parts[1]
-                # 확장자 제거
-                if '.' in actual_filename:
-                    actual_filename = actual_filename.rsplit('.', 1)[0]
+            stored_filename, actual_filename = self._resolve_document_names(file_url, filename)
             
             logger.info(f"📄 문서 추가 시작: {actual_filename} (저장된 파일명: {stored_filename})")
             logger.info(f"📄 파일 URL: {file_url}")
             
-            # 기존 임베딩이 있다면 제거 (stored_filename으로 정확한 매칭)
-            self._remove_existing_document(stored_filename)
-            
             # 문서 로드
             logger.info(f"📖 문서 로드 시도: {stored_filename}")
             content = self._load_document(file_url, stored_filename)
@@ -619,37 +854,41 @@ class RAGSystem:
                 logger.error(f"❌ 텍스트 분할 결과가 비어있습니다: {stored_filename}")
                 return False
             
-            # 각 청크에 대해 임베딩 생성
-            successful_embeddings = 0
-            for i, chunk in enumerate(chunks):
-                try:
-                    embedding = self._get_embedding(chunk)
-                    if embedding and len(embedding) > 0:
-                        self.documents.append({
-                            'content': chunk,
-                            'filename': actual_filename,
-                            'stored_filename': stored_filename,
-                            'chunk_id': i
-                        })
-                        self.embeddings.append(embedding)
-                        self.vector_store[f"{actual_filename}_{i}"] = embedding
-                        successful_embeddings += 1
-                        logger.info(f"✅ 청크 {i+1}/{len(chunks)} 임베딩 완료")
-                    else:
-                        logger.error(f"❌ 청크 {i+1}/{len(chunks)} 임베딩 실패")
-                except Exception as e:
-                    logger.error(f"❌ 청크 {i+1}/{len(chunks)} 임베딩 중 오류: {e}")
-                    continue
+            # 청크 임베딩은 배치 단위로 한 번에 요청 (네트워크 대기 구간이므로 잠금 밖에서 수행)
+            new_chunks = []
+            for i, (chunk, embedding) in enumerate(zip(chunks, self._get_embeddings_in_batches(chunks))):
+                if embedding and len(embedding) > 0:
+                    new_chunks.append((i, chunk, embedding))
+                else:
+                    logger.error(f"❌ 청크 {i+1}/{len(chunks)} 임베딩 실패")
             
+            successful_embeddings = len(new_chunks)
             if successful_embeddings == 0:
                 logger.error(f"❌ 모든 청크 임베딩 실패: {stored_filename}")
                 return False
             
+            with self._lock:
+                # 기존에 같은 파일이 임베딩되어 있다면 제거 (stored_filename으로 정확한 매칭)
+                self._remove_existing_document_unlocked(filename)
+                self._remove_existing_document_unlocked(stored_filename)
+                
+                for i, chunk, embedding in new_chunks:
+                    self.documents.append({
+                        'content': chunk,
+                        'filename': actual_filename,
+                        'stored_filename': stored_filename,
+                        'chunk_id': i
+                    })
+                    self.embeddings.append(embedding)
+                    self.vector_store[f"{actual_filename}_{i}"] = embedding
+                self._invalidate_search_caches()
+            
             # 벡터 저장소 저장
-            save_success = self._save_vector_store()
-            if not save_success:
-                logger.error(f"❌ 벡터 저장소 저장 실패: {stored_filename}")
-                return False
+            if save:
+                save_success = self._save_vector_store()
+                if not save_success:
+                    logger.error(f"❌ 벡터 저장소 저장 실패: {stored_filename}")
+                    return False
             
             # 스토리지에 임베딩 상태 표시
             try:
@@ -668,6 +907,162 @@ class RAGSystem:
             logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
             return False
     
+    def add_documents_batch(self, files, on_document_done=None, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
+        """여러 문서를 추가하면서 모든 문서의 청크를 모아 배치 단위로 임베딩
+        
+        files: (file_url, filename) iterable (큐에서 꺼내는 제너레이터도 가능)
+        on_document_done: 문서별 완료 콜백 (stored_filename, success)
+        metadata: 원본 파일명 조회용 메타데이터 (없으면 한 번만 조회)
+        반환값: {stored_filename: success}
+        """
+        results = {}
+        try:
+            logger.info("🔍 배치 문서 추가 시작")
+            
+            if not self.storage:
+                logger.error("❌ 스토리지가 초기화되지 않았습니다")
+                return results
+            
+            # OpenAI API 키 확인
+            if not self.openai_api_key:
+                logger.error("❌ OpenAI API 키가 설정되지 않았습니다")
+                return results
+            
+            # 메타데이터는 한 번만 조회
+            if metadata is None:
+                metadata = self.storage.get_metadata()
+            
+            pending = []  # (stored_filename, actual_filename, chunk_id, text)
+            chunk_counts = {}
+            successful_embeddings = {}
+            
+            # 임베딩 요청은 embedding_concurrency개까지 동시에 보내고, 결과는 요청 순서대로 반영
+            embed_executor = ThreadPoolExecutor(max_workers=max(1, self.embedding_concurrency), thread_name_prefix='rag-embed')
+            in_flight = deque()  # (청크 묶음, future)
+            replaced = set()  # 기존 청크를 이미 제거한 파일 (stored_filename)
+            
+            def collect():
+                batch, future = in_flight.popleft()
+                embeddings = future.result()
+                with self._lock:
+                    # 새 임베딩이 하나 이상 나온 파일만 기존 청크 제거 (로드/임베딩 실패 시 기존 임베딩 유지)
+                    # 같은 묶음의 새 청크를 추가하기 전에 한 번만 제거
+                    for (stored_filename, actual_filename, _, _), embedding in zip(batch, embeddings):
+                        if embedding and stored_filename not in replaced:
+                            replaced.add(stored_filename)
+                            self._remove_existing_document_unlocked(actual_filename)
+                            self._remove_existing_document_unlocked(stored_filename)
+                    for (stored_filename, actual_filename, chunk_id, chunk), embedding in zip(batch, embeddings):
+                        if embedding and len(embedding) > 0:
+                            self.documents.append({
+                                'content': chunk,
+                                'filename': actual_filename,
+                                'stored_filename': stored_filename,
+                                'chunk_id': chunk_id
+                            })
+                            self.embeddings.append(embedding)
+                            self.vector_store[f"{actual_filename}_{chunk_id}"] = embedding
+                            successful_embeddings[stored_filename] += 1
+                        else:
+                            logger.error(f"❌ 청크 {chunk_id + 1} 임베딩 실패: {stored_filename}")
+                    self._invalidate_search_caches()
+            
+            def flush():
+                if not pending:
+                    return
+                batch = list(pending)
+                pending.clear()
+                in_flight.append((batch, embed_executor.submit(self._get_chunk_embeddings, [item[3] for item in batch])))
+                while len(in_flight) >= max(1, self.embedding_concurrency):
+                    collect()
+            
+            # 문서 로드/분할(추출 스레드)과 임베딩 API 호출(현재 스레드)을 겹쳐서 실행
+            extracted = queue.Queue(maxsize=4)
+            
+            def extract_worker():
+                try:
+                    for file_url, filename in files:
+                        stored_filename = None
+                        try:
+                            stored_filename, actual_filename = self._resolve_document_names(file_url, filename, metadata)
+                            
+                            # 문서 로드 (기존 임베딩은 새 임베딩이 생긴 뒤 collect에서 교체)
+                            content = self._load_document(file_url, stored_filename)
+                            if not content:
+                                logger.error(f"❌ 문서 로드 실패: {stored_filename}")
+                                extracted.put((stored_filename, actual_filename, None))
+                                continue
+                            
+                            # 텍스트 분할
+                            chunks = self._split_text(content)
+                            if not chunks:
+                                logger.error(f"❌ 텍스트 분할 결과가 비어있습니다: {stored_filename}")
+                            extracted.put((stored_filename, actual_filename, chunks))
+                        except Exception as e:
+                            logger.error(f"❌ 배치 문서 처리 중 오류: {filename} - {e}")
+                            # 실패도 결과와 완료 콜백으로 알리도록 청크 없이 전달
+                            extracted.put((stored_filename or filename, None, None))
+                finally:
+                    extracted.put(None)
+            
+            extractor = threading.Thread(target=extract_worker, name='rag-extract', daemon=True)
+            extractor.start()
+            item = ()
+            try:
+                while True:
+                    item = extracted.get()
+                    if item is None:
+                        break
+                    stored_filename, actual_filename, chunks = item
+                    results[stored_filename] = False
+                    successful_embeddings[stored_filename] = 0
+                    if not chunks:
+                        continue
+                    
+                    chunk_counts[stored_filename] = len(chunks)
+                    for i, chunk in enumerate(chunks):
+                        pending.append((stored_filename, actual_filename, i, chunk))
+                        if len(pending) >= self.embedding_batch_size:
+                            flush()
+                
+                # 남은 청크 처리
+                flush()
+                while in_flight:
+                    collect()
+            finally:
+                # 중간에 오류가 나도 추출 스레드가 put에서 멈추지 않도록 남은 큐를 비움
+                while item is not None:
+                    item = extracted.get()
+                extractor.join()
+                embed_executor.shutdown(wait=True)
+            
+            # 벡터 저장소는 마지막에 한 번만 저장
+            save_success = True
+            if any(successful_embeddings.values()):
+                save_success = self._save_vector_store()
+                if not save_success:
+                    logger.error("❌ 벡터 저장소 저장 실패")
+            
+            for stored_filename in results:
+                success = save_success and successful_embeddings.get(stored_filename, 0) > 0
+                results[stored_filename] = success
+                if success:
+                    logger.info(f"✅ 문서 추가 완료: {stored_filename} ({successful_embeddings[stored_filename]}/{chunk_counts[stored_filename]}개 청크 성공)")
+                if on_document_done:
+                    try:
+                        on_document_done(stored_filename, success)
+                    except Exception as callback_error:
+                        logger.warning(f"⚠️ 문서 완료 콜백 실패: {stored_filename} - {callback_error}")
+            
+            logger.info(f"🔍 배치 추가 후 상태: 파일 {len(results)}개 처리, 문서 {len(self.documents)}개, 임베딩 {len(self.embeddings)}개")
+            return results
+            
+        except Exception as e:
+            logger.error(f"❌ 배치 문서 추가 실패: {e}")
+            import traceback
+            logger.error(f"❌ 상세 오류: {traceback.format_exc()}")
+            return results
+    
     def _load_document(self, file_url: str, filename: str) -> Optional[str]:
         """문서 로드"""
         try:
@@ -700,56 +1095,52 @@ class RAGSystem:
             
             logger.info(f"📖 문서 로드 시작: {filename} (확장자: {file_ext})")
             
-            # 임시 파일로 다운로드
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_ext}") as temp_file:
-                logger.info(f"📥 파일 다운로드 시작: {file_url}")
-                
-                if file_url.startswith('gs://'):
-                    # Google Cloud Storage URL에서 다운로드
-                    logger.info(f"☁️ Cloud Storage 다운로드 시도: {file_url}")
-                    if self.storage and hasattr(self.storage, 'bucket'):
-                        # Cloud Storage 클라이언트 사용
-                        blob_name = file_url.replace(f"gs://{self.storage.bucket_name}/", "")
-                        logger.info(f"📄 Blob 이름: {blob_name}")
-                        blob = self.storage.bucket.blob(blob_name)
-                        
-                        if not blob.exists():
-                            logger.error(f"❌ Blob이 존재하지 않음: {blob_name}")
-                            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {blob_name}")
-                        
+            # 메모리로 다운로드 (임시 파일에 쓰고 다시 읽지 않고 바로 파싱)
+            logger.info(f"📥 파일 다운로드 시작: {file_url}")
+            if file_url.startswith('gs://'):
+                # Google Cloud Storage URL에서 다운로드
+                logger.info(f"☁️ Cloud Storage 다운로드 시도: {file_url}")
+                if self.storage and hasattr(self.storage, 'bucket'):
+                    # Cloud Storage 클라이언트 사용
+                    blob_name = file_url.removeprefix(f"gs://{self.storage.bucket_name}/")
+                    logger.info(f"📄 Blob 이름: {blob_name}")
+                    blob = self.storage.bucket.blob(blob_name)
+                    
+                    # exists() 사전 확인 없이 GET 한 번으로 처리 (없으면 404)
+                    try:
                         content = blob.download_as_bytes()
-                        temp_file.write(content)
-                        logger.info(f"✅ Cloud Storage에서 다운로드: {len(content)} bytes")
-                    else:
-                        raise ValueError("Cloud Storage 클라이언트가 설정되지 않았습니다")
+                    except NotFound:
+                        logger.error(f"❌ Blob이 존재하지 않음: {blob_name}")
+                        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {blob_name}")
+                    logger.info(f"✅ Cloud Storage에서 다운로드: {len(content)} bytes")
                 else:
-                    # HTTP URL에서 다운로드
-                    logger.info(f"🌐 HTTP URL 다운로드 시도: {file_url}")
-                    response = requests.get(file_url)
-                    response.raise_for_status()
-                    temp_file.write(response.content)
-                    logger.info(f"✅ HTTP URL에서 다운로드: {len(response.content)} bytes")
-                
-                temp_file_path = temp_file.name
-                logger.info(f"📄 임시 파일 경로: {temp_file_path}")
+                    raise ValueError("Cloud Storage 클라이언트가 설정되지 않았습니다")
+            else:
+                # HTTP URL에서 다운로드
+                logger.info(f"🌐 HTTP URL 다운로드 시도: {file_url}")
+                response = self._http.get(file_url, timeout=60)
+                response.raise_for_status()
+                content = response.content
+                logger.info(f"✅ HTTP URL에서 다운로드: {len(content)} bytes")
             
             # 파일 내용 읽기
             if file_ext == 'pdf':
                 try:
                     import PyPDF2
-                    with open(temp_file_path, 'rb') as f:
-                        pdf_reader = PyPDF2.PdfReader(f)
-                        text = ""
-                        for page_num, page in enumerate(pdf_reader.pages):
-                            try:
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                                else:
-                                    logger.warning(f"⚠️ PDF 페이지 {page_num + 1}에서 텍스트 추출 실패")
-                            except Exception as page_error:
-                                logger.warning(f"⚠️ PDF 페이지 {page_num + 1} 처리 중 오류: {page_error}")
-                                continue
+                    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+                    # 페이지 텍스트를 모아 한 번에 합침 (문자열 += 반복 복사 방지)
+                    page_texts = []
+                    for page_num, page in enumerate(pdf_reader.pages):
+                        try:
+                            page_text = page.extract_text()
+                            if page_text:
+                                page_texts.append(page_text)
+                            else:
+                                logger.warning(f"⚠️ PDF 페이지 {page_num + 1}에서 텍스트 추출 실패")
+                        except Exception as page_error:
+                            logger.warning(f"⚠️ PDF 페이지 {page_num + 1} 처리 중 오류: {page_error}")
+                            continue
+                    text = "\n".join(page_texts)
                     
                     if not text.strip():
                         logger.error("❌ PDF에서 텍스트를 추출할 수 없습니다")
@@ -764,7 +1155,7 @@ class RAGSystem:
             elif file_ext in ['docx', 'doc']:
                 try:
                     import docx2txt
-                    text = docx2txt.process(temp_file_path)
+                    text = docx2txt.process(io.BytesIO(content))
                     if not text or not text.strip():
                         logger.error("❌ DOCX 파일에서 텍스트를 추출할 수 없습니다")
                         return None
@@ -775,14 +1166,13 @@ class RAGSystem:
                     logger.error(f"❌ DOCX 파일 읽기 실패: {docx_error}")
                     return None
             elif file_ext == 'txt':
-                # 다양한 인코딩으로 시도
+                # 다양한 인코딩으로 시도 (바이트를 바로 디코딩, 텍스트 모드 파일 읽기와 같은 줄바꿈 처리)
                 encodings = ['utf-8', 'cp949', 'euc-kr', 'latin-1', 'iso-8859-1']
                 text = None
                 
                 for encoding in encodings:
                     try:
-                        with open(temp_file_path, 'r', encoding=encoding) as f:
-                            text = f.read()
+                        text = content.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
                         logger.info(f"✅ 텍스트 파일 읽기 성공: {encoding} 인코딩 사용")
                         break
                     except UnicodeDecodeError:
@@ -799,9 +1189,6 @@ class RAGSystem:
                 logger.error(f"❌ 지원하지 않는 파일 형식: {file_ext}")
                 return None
             
-            # 임시 파일 삭제
-            os.unlink(temp_file_path)
-            
             logger.info(f"✅ 문서 로드 완료: {filename} ({len(text)} 문자)")
             return text
             
@@ -827,28 +1214,17 @@ class RAGSystem:
                 return "OpenAI API 키가 설정되지 않았습니다. 관리자에게 문의해주세요."
             
             # 파일명 관련 질문에 대한 특별 처리
-            filename_keywords = [
-                '파일명', '문서명', '저장하고 있는', '업로드된', '문서가 뭐', 
-                '저장되어 있는', '문서 목록', '목록', '리스트', '어떤 문서',
-                '무슨 문서', '문서들', '파일들', '업로드한', '등록된'
-            ]
-            if any(keyword in question.lower() for keyword in filename_keywords):
+            if _FILENAME_QUESTION_RE.search(question.lower()):
                 return self._handle_filename_question(question)
             
             # 질문 임베딩 생성
-            question_embedding = self._get_embedding(question)
+            question_embedding = self._get_query_embedding(question)
             if not question_embedding:
                 return "질문 처리 중 오류가 발생했습니다."
             
-            # 가장 유사한 문서 찾기 (상위 5개로 확장)
-            similarities = []
-            for i, doc_embedding in enumerate(self.embeddings):
-                score = self._cosine_similarity(question_embedding, doc_embedding)
-                similarities.append((score, i))
-            
-            # 유사도 순으로 정렬하고 상위 5개 선택 (검색 정확도 향상)
-            similarities.sort(reverse=True)
-            top_docs = similarities[:5]
+            # 가장 유사한 문서 찾기 (상위 5개로 확장, 전체 유사도는 행렬 곱 한 번으로 계산)
+            scores = self._similarity_scores(question_embedding)
+            top_docs = [(float(scores[i]), int(i)) for i in self._top_k_indices(scores, 5)]
             
             # 디버깅을 위한 로그 추가
             logger.info(f"🔍 검색 결과: 상위 5개 유사도 점수 = {[f'{score:.3f}' for score, _ in top_docs[:5]]}")
@@ -887,6 +1263,13 @@ class RAGSystem:
                     for conv in relevant_contexts:
                         context_info += f"Q: {conv['question']}\nA: {conv['answer']}\n\n"
             
+            # 이전 대화 맥락이 없으면 같은 의미의 질문에 대한 답변 재사용
+            if not context_info:
+                cached_answer = self._lookup_cached_answer(question, question_embedding)
+                if cached_answer is not None:
+                    logger.info(f"✅ 유사 질문 답변 캐시 사용: {question[:50]}...")
+                    return cached_answer
+            
             # OpenAI로 답변 생성
             prompt = f"""다음 문서들을 바탕으로 질문에 답변해주세요.
 각 문서의 제목(파일명)을 주의 깊게 살펴보고, 해당 문서와 관련된 내용을 우선적으로 참고해주세요.
@@ -912,74 +1295,41 @@ class RAGSystem:
             
             # OpenAI API 직접 호출 (httpx 사용)
             try:
-                import httpx
-                import os
-                import json
+                # 공유 클라이언트 재사용 (연결 풀 유지, 프록시 환경 변수 무시)
+                http_client = self._get_openai_http_client()
                 
-                # 프록시 관련 환경 변수 완전 제거
-                old_proxy_vars = {}
-                proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy']
-                for var in proxy_vars:
-                    if var in os.environ:
-                        old_proxy_vars[var] = os.environ[var]
-                        del os.environ[var]
+                # OpenAI API 직접 호출
+                headers = {
+                    "Authorization": f"Bearer {self.openai_api_key}",
+                    "Content-Type": "application/json"
+                }
                 
-                try:
-                    # httpx 클라이언트 생성 (프록시 인수 제거)
-                    try:
-                        # httpx 버전에 따라 proxies 인수 지원 여부 확인
-                        http_client = httpx.Client(
-                            timeout=30.0,
-                            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-                        )
-                    except TypeError as e:
-                        if "proxies" in str(e):
-                            # proxies 인수가 지원되지 않는 경우 기본 클라이언트 사용
-                            http_client = httpx.Client(
-                                timeout=30.0
-                            )
-                        else:
-                            raise e
-                    
-                    # OpenAI API 직접 호출
-                    headers = {
-                        "Authorization": f"Bearer {self.openai_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                    
-                    data = {
-                        "model": self.llm_model,
-                        "messages": [
-                            {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다. **중요: 오직 제공된 문서의 내용만을 사용하여 답변해주세요.** 외부 지식이나 일반적인 법률 지식을 사용하지 마세요. 사용자가 '전체 내용을 그대로 보여달라'고 요청하면, 해당 조항의 모든 내용을 빠짐없이 완전히 제공해주세요. 각 문서의 제목(파일명)을 주의 깊게 살펴보고, 해당 문서와 관련된 내용을 우선적으로 참고해주세요. 사용자가 '저장하고 있는 문서가 뭐지?', '파일명을 알려달라' 등의 질문을 하면, 참고 문서들에서 파일명(=== 파일명 === 형태)을 찾아서 정확히 알려주세요. **절대로 제공된 문서에 없는 조항, 법령, 규정을 언급하지 마세요.** 문서에 없는 내용은 추측하지 말고, 문서 내용과 이전 대화 맥락만을 바탕으로 답변해주세요. 만약 질문에 대한 답변이 제공된 문서에 없다면, '제공된 문서에는 해당 내용이 없습니다. 더 자세한 정보가 필요하시면 관련 문서를 업로드해주세요.'라고 답변해주세요."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": 2000,
-                        "temperature": 0.3
-                    }
-                    
-                    response = http_client.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers=headers,
-                        json=data
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        answer = result['choices'][0]['message']['content'].strip()
-                    else:
-                        raise Exception(f"OpenAI API 오류: {response.status_code} - {response.text}")
-                    
-                finally:
-                    # 환경 변수 복원
-                    for var, value in old_proxy_vars.items():
-                        os.environ[var] = value
-                    # HTTP 클라이언트 정리
-                    if 'http_client' in locals():
-                        http_client.close()
-                        
+                data = {
+                    "model": self.llm_model,
+                    "messages": [
+                        {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다. **중요: 오직 제공된 문서의 내용만을 사용하여 답변해주세요.** 외부 지식이나 일반적인 법률 지식을 사용하지 마세요. 사용자가 '전체 내용을 그대로 보여달라'고 요청하면, 해당 조항의 모든 내용을 빠짐없이 완전히 제공해주세요. 각 문서의 제목(파일명)을 주의 깊게 살펴보고, 해당 문서와 관련된 내용을 우선적으로 참고해주세요. 사용자가 '저장하고 있는 문서가 뭐지?', '파일명을 알려달라' 등의 질문을 하면, 참고 문서들에서 파일명(=== 파일명 === 형태)을 찾아서 정확히 알려주세요. **절대로 제공된 문서에 없는 조항, 법령, 규정을 언급하지 마세요.** 문서에 없는 내용은 추측하지 말고, 문서 내용과 이전 대화 맥락만을 바탕으로 답변해주세요. 만약 질문에 대한 답변이 제공된 문서에 없다면, '제공된 문서에는 해당 내용이 없습니다. 더 자세한 정보가 필요하시면 관련 문서를 업로드해주세요.'라고 답변해주세요."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": 2000,
+                    "temperature": 0.3
+                }
+                
+                response = http_client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers=headers,
+                    json=data
+                )
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    answer = result['choices'][0]['message']['content'].strip()
+                else:
+                    raise Exception(f"OpenAI API 오류: {response.status_code} - {response.text}")
             except Exception as client_error:
                 logger.error(f"❌ OpenAI API 호출 실패: {client_error}")
                 raise Exception(f"OpenAI API 호출 실패: {client_error}")
+            if not context_info:
+                self._store_cached_answer(question, question_embedding, answer)
             logger.info(f"✅ 질의응답 완료: {question[:50]}...")
             return answer
             
@@ -989,48 +1339,32 @@ class RAGSystem:
     
     def _get_related_chunk_indices(self, chunk_idx: int) -> List[int]:
         """특정 청크와 관련된 모든 청크 인덱스 반환"""
-        related_indices = [chunk_idx]
-        current_doc = self.documents[chunk_idx]
-        filename = current_doc['filename']
-        
-        # 같은 파일의 모든 청크 찾기
-        for i, doc in enumerate(self.documents):
-            if doc['filename'] == filename:
-                related_indices.append(i)
+        filename = self.documents[chunk_idx]['filename']
         
-        return related_indices
+        # 같은 파일의 모든 청크 (파일명 인덱스에서 바로 조회)
+        siblings = self._get_chunks_by_filename().get(filename, [])
+        return [chunk_idx] + [i for _, i in siblings]
     
     def _get_connected_chunks(self, chunk_idx: int, display_name: str) -> str:
         """연속된 청크들을 연결해서 반환 (스마트 선택)"""
         current_doc = self.documents[chunk_idx]
         filename = current_doc['filename']
         
-        # 같은 파일의 모든 청크들을 chunk_id 순으로 정렬
-        same_file_chunks = []
-        for i, doc in enumerate(self.documents):
-            if doc['filename'] == filename:
-                same_file_chunks.append((doc['chunk_id'], i, doc['content']))
+        # 같은 파일의 청크들 (chunk_id 순으로 정렬된 파일명 인덱스)
+        same_file_chunks = self._get_chunks_by_filename().get(filename, [])
         
-        # chunk_id 순으로 정렬
-        same_file_chunks.sort(key=lambda x: x[0])
-        
-        # 현재 청크 주변의 청크들을 우선 선택
+        # 현재 청크를 중심으로 앞뒤 청크들 선택 (현재 청크 ±2 범위를 이진 탐색)
         current_chunk_id = current_doc['chunk_id']
-        selected_chunks = []
-        
-        # 현재 청크를 중심으로 앞뒤 청크들 선택
-        for chunk_id, idx, content in same_file_chunks:
-            if abs(chunk_id - current_chunk_id) <= 2:  # 현재 청크 ±2 범위
-                selected_chunks.append((chunk_id, idx, content))
+        start = bisect.bisect_left(same_file_chunks, (current_chunk_id - 2, -1))
+        end = bisect.bisect_right(same_file_chunks, (current_chunk_id + 2, len(self.documents)))
         
         # 토큰 제한을 고려하여 최대 3개 청크만 사용
-        if len(selected_chunks) > 3:
-            selected_chunks = selected_chunks[:3]
+        selected_chunks = same_file_chunks[start:end][:3]
         
         # 연속된 청크들을 연결
         connected_content = ""
-        for chunk_id, idx, content in selected_chunks:
-            connected_content += content + "\n"
+        for chunk_id, idx in selected_chunks:
+            connected_content += self.documents[idx]['content'] + "\n"
         
         logger.info(f"📄 {display_name}: {len(selected_chunks)}개 청크 연결됨 (전체 {len(same_file_chunks)}개 중)")
         return connected_content.strip()
@@ -1071,9 +1405,7 @@ class RAGSystem:
             self._delete_vector_store()
             
             # 메모리에서도 초기화
-            self.documents = []
-            self.embeddings = []
-            self.vector_store = {}
+            self.clear_memory()
             
             # 스토리지에 임베딩 상태 업데이트
             try:
@@ -1095,20 +1427,25 @@ class RAGSystem:
     def rebuild_index(self) -> bool:
         """인덱스 재구성"""
         try:
-            # 기존 문서들로 인덱스 재구성
-            old_documents = self.documents.copy()
-            old_embeddings = self.embeddings.copy()
-            
-            self.documents = []
-            self.embeddings = []
-            self.vector_store = {}
-            
-            for doc in old_documents:
-                embedding = self._get_embedding(doc['content'])
+            # 기존 문서들로 인덱스 재구성 (청크 내용을 모아 배치 임베딩)
+            with self._lock:
+                old_documents = self.documents.copy()
+            embeddings = self._get_embeddings_in_batches([doc['content'] for doc in old_documents])
+            
+            documents = []
+            new_embeddings = []
+            vector_store = {}
+            for doc, embedding in zip(old_documents, embeddings):
                 if embedding:
-                    self.documents.append(doc)
-                    self.embeddings.append(embedding)
-                    self.vector_store[f"{doc['filename']}_{doc['chunk_id']}"] = embedding
+                    documents.append(doc)
+                    new_embeddings.append(embedding)
+                    vector_store[f"{doc['filename']}_{doc['chunk_id']}"] = embedding
+            
+            with self._lock:
+                self.documents = documents
+                self.embeddings = new_embeddings
+                self.vector_store = vector_store
+                self._invalidate_search_caches()
             
             # 저장
             self._save_vector_store()
@@ -1129,9 +1466,7 @@ class RAGSystem:
             old_doc_count = len(self.documents)
             old_embedding_count = len(self.embeddings)
             
-            self.documents = []
-            self.embeddings = []
-            self.vector_store = {}
+            self.clear_memory()
             
             # 벡터 저장소 파일 삭제
             self._delete_vector_store()
@@ -1172,6 +1507,24 @@ class RAGSystem:
         logger.info(f"🔍 RAG 상태 조회: 문서 {len(self.documents)}개, 임베딩 {len(self.embeddings)}개, 모델 {self.embedding_model}")
         return status
     
+    def _get_vector_file_info(self) -> tuple:
+        """벡터 저장소 파일의 (존재 여부, 크기) 조회 (TTL 캐시)"""
+        cached = self._vector_file_info_cache
+        if cached and time.time() - cached[0] < self.vector_file_info_ttl:
+            return cached[1], cached[2]
+        
+        # vector_store/ 목록 조회 한 번으로 존재 여부와 크기를 함께 가져옴 (이전 pickle 형식 포함)
+        sizes = {blob.name: blob.size or 0 for blob in self.storage.bucket.list_blobs(prefix="vector_store/", fields="items(name,size),nextPageToken")}
+        if VECTOR_DOCUMENTS_BLOB in sizes or LEGACY_VECTOR_STORE_BLOB in sizes:
+            file_exists, db_size = True, sum(sizes.values())
+            logger.info(f"🔍 Cloud Storage 벡터 파일 크기: {db_size} bytes")
+        else:
+            file_exists, db_size = False, 0
+            logger.info("ℹ️ Cloud Storage에 벡터 파일이 존재하지 않음")
+        
+        self._vector_file_info_cache = (time.time(), file_exists, db_size)
+        return file_exists, db_size
+    
     def get_vector_db_info(self) -> Dict[str, Any]:
         """벡터 DB 상세 정보 반환 (안전한 버전)"""
         logger.info(f"🔍 벡터 DB 정보 조회: 메모리 문서 {len(self.documents)}개, 임베딩 {len(self.embeddings)}개")
@@ -1191,13 +1544,7 @@ class RAGSystem:
         # Cloud Storage 정보는 안전하게 확인 (오류 시 무시)
         if self.storage and hasattr(self.storage, 'bucket'):
             try:
-                vector_blob = self.storage.bucket.blob('vector_store/vector_store.pkl')
-                file_exists = vector_blob.exists()
-                if file_exists:
-                    db_size = vector_blob.size
-                    logger.info(f"🔍 Cloud Storage 벡터 파일 크기: {db_size} bytes")
-                else:
-                    logger.info("ℹ️ Cloud Storage에 벡터 파일이 존재하지 않음")
+                file_exists, db_size = self._get_vector_file_info()
             except Exception as e:
                 logger.warning(f"⚠️ Cloud Storage 정보 확인 실패 (무시): {e}")
                 # 오류 시에도 기본 정보는 반환
@@ -1206,7 +1553,7 @@ class RAGSystem:
             'total_vectors': actual_vectors,
             'dimensions': dimensions,
             'db_size_mb': round(db_size / (1024**2), 2) if db_size and db_size > 0 else 0,
-            'index_type': 'pickle',
+            'index_type': 'npy',
             'storage_path': 'Cloud Storage' if self.storage and hasattr(self.storage, 'bucket') else 'unknown',
             'file_exists': file_exists,
             'embedding_model': self.embedding_model
@@ -1226,7 +1573,7 @@ class RAGSystem:
                 }
             
             # 쿼리 임베딩 생성
-            query_embedding = self._get_embedding(query)
+            query_embedding = self._get_query_embedding(query)
             if not query_embedding:
                 return {
                     'query': query,
@@ -1234,23 +1581,18 @@ class RAGSystem:
                     'message': '쿼리 임베딩 생성에 실패했습니다.'
                 }
             
-            # 유사도 계산
-            similarities = []
-            for i, embedding in enumerate(self.embeddings):
-                similarity = self._cosine_similarity(query_embedding, embedding)
-                similarities.append({
-                    'index': i,
-                    'similarity': similarity,
-                    'document': self.documents[i] if i < len(self.documents) else 'Unknown'
-                })
-            
-            # 유사도 순으로 정렬
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
+            # 유사도 계산 후 상위 5개만 정렬
+            scores = self._similarity_scores(query_embedding)
+            similarities = [{
+                'index': int(i),
+                'similarity': float(scores[i]),
+                'document': self.documents[i] if i < len(self.documents) else 'Unknown'
+            } for i in self._top_k_indices(scores, 5)]
             
             return {
                 'query': query,
-                'results': similarities[:5],  # 상위 5개 결과
-                'total_results': len(similarities),
+                'results': similarities,  # 상위 5개 결과
+                'total_results': len(scores),
                 'message': '검색 테스트가 완료되었습니다.'
             }
             
@@ -1262,67 +1604,98 @@ class RAGSystem:
                 'message': f'검색 테스트 실패: {str(e)}'
             }
     
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """코사인 유사도 계산"""
-        try:
-            vec1 = np.array(vec1)
-            vec2 = np.array(vec2)
-            
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            return dot_product / (norm1 * norm2)
-            
-        except Exception as e:
-            logger.error(f"코사인 유사도 계산 실패: {e}")
-            return 0.0
+    def _invalidate_search_caches(self):
+        """문서/임베딩이 바뀌었을 때 검색용 캐시 폐기 (다음 검색에서 다시 구성)"""
+        self.mutation_count += 1
+        self._emb_matrix = None
+        self._chunks_by_filename = None
+        with self._answer_cache_lock:
+            self._answer_cache.clear()
+    
+    def _lookup_cached_answer(self, question: str, question_embedding: List[float]) -> Optional[str]:
+        """코사인 유사도가 answer_cache_threshold 이상이고 숫자(조항 번호 등)가 같은 이전 질문의 답변 반환"""
+        with self._answer_cache_lock:
+            now = time.time()
+            entries = [entry for entry in self._answer_cache
+                       if now - entry[4] < self.answer_cache_ttl and entry[2] == self.llm_model]
+        if not entries:
+            return None
+        
+        query_vector = np.array(question_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector) + 1e-12
+        similarities = np.array([entry[0] for entry in entries]) @ query_vector
+        digits = _DIGITS_RE.findall(question)
+        # 가장 비슷한 질문부터 확인 ('제3조'와 '제4조'처럼 숫자만 다른 질문은 재사용하지 않음)
+        for i in np.argsort(similarities)[::-1]:
+            if similarities[i] < self.answer_cache_threshold:
+                break
+            if entries[i][1] == digits:
+                return entries[i][3]
+        return None
+    
+    def _store_cached_answer(self, question: str, question_embedding: List[float], answer: str):
+        """답변 캐시에 저장 (가득 차면 가장 오래된 항목부터 밀려남)"""
+        query_vector = np.array(question_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector) + 1e-12
+        with self._answer_cache_lock:
+            self._answer_cache.append((query_vector, _DIGITS_RE.findall(question), self.llm_model, answer, time.time()))
+    
+    def _get_chunks_by_filename(self) -> Dict[str, List[tuple]]:
+        """파일명 -> chunk_id 순으로 정렬된 (chunk_id, 전체 인덱스) 목록 (캐시)"""
+        with self._lock:
+            if self._chunks_by_filename is None:
+                chunks_by_filename = {}
+                for i, doc in enumerate(self.documents):
+                    chunks_by_filename.setdefault(doc['filename'], []).append((doc['chunk_id'], i))
+                for siblings in chunks_by_filename.values():
+                    siblings.sort()
+                self._chunks_by_filename = chunks_by_filename
+            return self._chunks_by_filename
+    
+    def _get_embedding_matrix(self) -> np.ndarray:
+        """임베딩 리스트를 행별로 정규화한 float32 (N, D) 행렬로 변환해 캐시 (코사인 유사도 = 내적)"""
+        with self._lock:
+            if self._emb_matrix is None:
+                matrix = np.array(self.embeddings, dtype=np.float32)
+                matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+                self._emb_matrix = matrix
+            return self._emb_matrix
+    
+    def _similarity_scores(self, query_embedding: List[float]) -> np.ndarray:
+        """질의 임베딩과 모든 청크 임베딩의 코사인 유사도 (정규화된 행렬과 내적 한 번)"""
+        query_vector = np.array(query_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector) + 1e-12
+        return self._get_embedding_matrix() @ query_vector
+    
+    def _top_k_indices(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """유사도 상위 k개 인덱스를 높은 순으로 반환 (전체 정렬 없이 argpartition)"""
+        if len(scores) <= k:
+            return np.argsort(-scores)
+        top = np.argpartition(-scores, k)[:k]
+        return top[np.argsort(-scores[top])]
     
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드 추출 (개선)"""
-        # 한국어 불용어 제거
-        stopwords = ['은', '는', '이', '가', '을', '를', '에', '의', '로', '으로', '에서', '에게', '와', '과', '도', '만', '부터', '까지', '한', '두', '세', '네', '다섯', '여섯', '일곱', '여덟', '아홉', '열']
-        
-        # 간단한 키워드 추출 (공백으로 분리)
-        words = text.split()
-        keywords = []
-        
-        for word in words:
-            # 불용어 제거 및 길이 체크
-            if word not in stopwords and len(word) > 1:
-                keywords.append(word)
+        # 간단한 키워드 추출 (공백으로 분리, 불용어 제거 및 길이 체크)
+        keywords = [word for word in text.split() if len(word) > 1 and word not in _STOPWORDS]
         
-        # 조항 관련 키워드 추가
-        if any(keyword in text for keyword in ['조', '항', '호', '목']):
+        # 조항 관련 키워드 추가 (텍스트 한 번 탐색)
+        if _ARTICLE_CHAR_RE.search(text):
             keywords.extend(['조항', '법조문', '규정'])
         
         return keywords
     
+    def _extract_conversation_features(self, question: str, answer: str) -> tuple:
+        """이전 대화의 (키워드 frozenset, 답변 속 조항 표기 수) 계산 (캐시 미스 시)"""
+        keywords = frozenset(self._extract_keywords(question + ' ' + answer))
+        return keywords, len(self._extract_article_info(answer))
+    
     def _extract_article_info(self, answer_text: str) -> List[str]:
         """답변에서 조항 정보 추출"""
-        import re
-        
-        # 조항 패턴 감지
-        patterns = [
-            r'제\d+조',
-            r'제\d+항',
-            r'제\d+호',
-            r'제\d+목',
-            r'\d+조',
-            r'\d+항',
-            r'\d+호',
-            r'\d+목'
-        ]
-        
-        article_info = []
-        for pattern in patterns:
-            matches = re.findall(pattern, answer_text)
-            article_info.extend(matches)
-        
-        return article_info
+        # 한 번의 탐색으로 모든 조항 표기를 찾음
+        # ('제N조'는 'N조'로도 함께 집계되던 기존 점수 방식을 유지)
+        matches = _ARTICLE_RE.findall(answer_text)
+        return [prefix + article for prefix, article in matches if prefix] + [article for _, article in matches]
     
     def _select_relevant_context(self, current_question: str, chat_history: list, max_contexts: int = 3) -> list:
         """개선된 맥락 선택 (조항 정보 인식)"""
@@ -1339,8 +1712,7 @@ class RAGSystem:
             current_keywords = set(self._extract_keywords(current_question))
             
             # 맥락 연결 질문인지 확인 (관련, 조항, 내용 등)
-            context_connection_keywords = ['관련', '조항', '내용', '그것', '이것', '해당', '위에서', '앞서']
-            is_context_question = any(keyword in current_question for keyword in context_connection_keywords)
+            is_context_question = _CONTEXT_QUESTION_RE.search(current_question) is not None
             
             # 키워드가 부족하거나 맥락 연결 질문인 경우 최근 대화를 우선 선택
             if not current_keywords or len(current_keywords) < 2 or is_context_question:
@@ -1348,33 +1720,30 @@ class RAGSystem:
                 return recent_history[-1:] if recent_history else []
             
             # 조항 관련 질문인지 확인 (더 포괄적으로)
-            is_article_question = any(keyword in current_question for keyword in ['조', '항', '호', '목', '몇', '조항', '규정', '내용'])
+            is_article_question = _ARTICLE_QUESTION_RE.search(current_question) is not None
             
             scored_contexts = []
             
             # 각 대화와 키워드 유사도 계산
             for conv in recent_history:
-                conv_text = conv['question'] + ' ' + conv['answer']
-                conv_keywords = set(self._extract_keywords(conv_text))
+                conv_keywords, article_count = self._conversation_features(conv['question'], conv['answer'])
                 
                 # 기본 키워드 유사도
                 overlap = len(current_keywords & conv_keywords)
                 
-                # 조항 관련 질문인 경우 이전 답변에서 조항 정보 추출
-                if is_article_question:
-                    article_info = self._extract_article_info(conv['answer'])
-                    if article_info:
-                        # 조항 정보가 있으면 높은 점수 부여
-                        overlap += len(article_info) * 2
+                # 조항 관련 질문인 경우 이전 답변의 조항 정보 반영
+                if is_article_question and article_count:
+                    # 조항 정보가 있으면 높은 점수 부여
+                    overlap += article_count * 2
                 
                 if overlap > 0:
                     # 유사도 점수 = 겹치는 키워드 수 / 현재 질문 키워드 수
                     similarity_score = overlap / len(current_keywords) if current_keywords else 0
                     scored_contexts.append((similarity_score, conv))
             
-            # 유사도 순으로 정렬하고 상위 N개 선택
-            scored_contexts.sort(reverse=True)
-            selected_contexts = [conv for _, conv in scored_contexts[:max_contexts]]
+            # 전체 정렬 없이 유사도 상위 N개만 선택 (동점이면 먼저 나온 대화 우선, 대화 dict끼리는 비교하지 않음)
+            top_contexts = heapq.nlargest(max_contexts, scored_contexts, key=lambda item: item[0])
+            selected_contexts = [conv for _, conv in top_contexts]
             
             logger.info(f"✅ 맥락 선택 완료: {len(selected_contexts)}개 대화 선택 (조항 질문: {is_article_question}, 총 히스토리: {len(chat_history)}개)")
             return selected_contexts
@@ -1383,18 +1752,86 @@ class RAGSystem:
             logger.error(f"❌ 맥락 선택 실패: {e}")
             return []
     
-    def backup_vectors(self, backup_path: str) -> bool:
-        """벡터 저장소 백업"""
+    def _download_vector_store(self) -> Optional[tuple]:
+        """Cloud Storage에서 벡터 저장소 로드 -> (documents, embeddings, vector_store), 없으면 None"""
+        # exists() 확인 없이 바로 다운로드 (없으면 NotFound)
         try:
-            backup_data = {
-                'documents': self.documents,
-                'embeddings': self.embeddings,
-                'vector_store': self.vector_store,
-                'backup_timestamp': datetime.now().isoformat()
+            documents_meta = _load_json(self.storage.bucket.blob(VECTOR_DOCUMENTS_BLOB).download_as_bytes())
+        except NotFound:
+            documents_meta = None
+        
+        if documents_meta is not None:
+            # 문서 목록이 가리키는 임베딩 blob을 받음 (그 사이 다른 인스턴스가 새로 저장해 지웠으면 NotFound -> 로드 재시도)
+            vector_blob_name = documents_meta.get('embeddings_blob')
+            if vector_blob_name:
+                vector_data = self.storage.bucket.blob(vector_blob_name).download_as_bytes()
+            else:
+                # 고정 이름을 쓰던 이전 형식 (세대 불일치 시 PreconditionFailed -> 로드 재시도)
+                vector_blob_name = VECTOR_EMBEDDINGS_BLOB
+                vector_data = self.storage.bucket.blob(vector_blob_name).download_as_bytes(
+                    if_generation_match=documents_meta.get('embeddings_generation')
+                )
+            embeddings = np.load(io.BytesIO(vector_data), allow_pickle=False)
+            self._persisted_vector_blobs = [vector_blob_name]
+            return self._unpack_vector_data({**documents_meta, 'embeddings_f16': embeddings, 'embedding_format': 'float16'})
+        
+        # 이전 pickle 형식 호환
+        try:
+            vector_data = self.storage.bucket.blob(LEGACY_VECTOR_STORE_BLOB).download_as_bytes()
+        except NotFound:
+            self._persisted_vector_blobs = []
+            return None
+        logger.info("ℹ️ 이전 형식(pickle) 벡터 저장소 로드")
+        self._persisted_vector_blobs = [LEGACY_VECTOR_STORE_BLOB]
+        return self._unpack_vector_data(pickle.loads(vector_data))
+    
+    def _unpack_vector_data(self, data: Dict[str, Any]) -> tuple:
+        """저장된 벡터 저장소 데이터 -> (documents, embeddings, vector_store)"""
+        documents = data.get('documents', [])
+        if data.get('embedding_format') == 'float16':
+            embeddings = data['embeddings_f16'].astype(np.float32).tolist()
+            vector_store = {
+                f"{doc['filename']}_{doc['chunk_id']}": embedding
+                for doc, embedding in zip(documents, embeddings)
             }
+        else:
+            # 이전 형식 (float 임베딩 리스트 + vector_store 그대로 저장) 호환
+            embeddings = data.get('embeddings', [])
+            vector_store = data.get('vector_store', {})
+        return documents, embeddings, vector_store
+    
+    def _quantize_embeddings(self, embeddings: list) -> tuple:
+        """임베딩을 벡터별 스케일의 int8로 양자화 -> (int8 배열, float32 스케일)"""
+        if not embeddings:
+            return np.zeros((0, 0), dtype=np.int8), np.zeros(0, dtype=np.float32)
+        
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0  # 0 벡터 나눗셈 방지
+        quantized = np.clip(np.round(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    
+    def _dequantize_embeddings(self, quantized, scales) -> list:
+        """int8 양자화 임베딩을 float 리스트로 복원"""
+        vectors = np.asarray(quantized, dtype=np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+        return vectors.tolist()
+    
+    def backup_vectors(self, backup_path: str) -> bool:
+        """벡터 저장소 백업 (임베딩은 int8 양자화로 약 1/4 크기)"""
+        try:
+            with self._lock:
+                quantized, scales = self._quantize_embeddings(self.embeddings)
+                backup_meta = {
+                    'documents': list(self.documents),
+                    'embedding_format': 'int8',
+                    'backup_timestamp': datetime.now().isoformat()
+                }
             
+            # pickle 없이 npz(zip)로 저장: 임베딩은 원시 배열, 문서 목록은 JSON 바이트
+            # (파일 객체로 넘겨 np.savez가 경로에 .npz를 덧붙이지 않게 함)
+            meta_bytes = np.frombuffer(_dump_json(backup_meta), dtype=np.uint8)
             with open(backup_path, 'wb') as f:
-                pickle.dump(backup_data, f)
+                np.savez(f, meta=meta_bytes, embeddings_int8=quantized, embedding_scales=scales)
             
             logger.info(f"✅ 벡터 저장소 백업 완료: {backup_path}")
             return True
@@ -1403,15 +1840,42 @@ class RAGSystem:
             logger.error(f"❌ 벡터 저장소 백업 실패: {e}")
             return False
     
-    def restore_vectors(self, backup_path: str) -> bool:
-        """벡터 저장소 복원"""
+    def restore_vectors(self, backup_path: str, allow_legacy_pickle: bool = False) -> bool:
+        """벡터 저장소 복원 (이전 pickle 백업은 allow_legacy_pickle=True로 명시한 경우에만 읽음)"""
         try:
             with open(backup_path, 'rb') as f:
-                backup_data = pickle.load(f)
+                if f.read(4) == b'PK\x03\x04':
+                    f.seek(0)
+                    with np.load(f, allow_pickle=False) as archive:
+                        backup_data = _load_json(archive['meta'].tobytes())
+                        backup_data['embeddings_int8'] = archive['embeddings_int8']
+                        backup_data['embedding_scales'] = archive['embedding_scales']
+                elif allow_legacy_pickle:
+                    # 이전 pickle 백업 호환 (신뢰할 수 있는 파일에만 사용)
+                    f.seek(0)
+                    backup_data = pickle.load(f)
+                else:
+                    logger.error(f"❌ npz 백업 파일이 아님 (이전 pickle 백업은 allow_legacy_pickle=True로 복원): {backup_path}")
+                    return False
             
-            self.documents = backup_data.get('documents', [])
-            self.embeddings = backup_data.get('embeddings', [])
-            self.vector_store = backup_data.get('vector_store', {})
+            documents = backup_data.get('documents', [])
+            if backup_data.get('embedding_format') == 'int8':
+                embeddings = self._dequantize_embeddings(backup_data['embeddings_int8'], backup_data['embedding_scales'])
+                # vector_store는 documents와 임베딩으로 재구성
+                vector_store = {
+                    f"{doc['filename']}_{doc['chunk_id']}": embedding
+                    for doc, embedding in zip(documents, embeddings)
+                }
+            else:
+                # 이전 형식 (float 임베딩 그대로 저장) 호환
+                embeddings = backup_data.get('embeddings', [])
+                vector_store = backup_data.get('vector_store', {})
+            
+            with self._lock:
+                self.documents = documents
+                self.embeddings = embeddings
+                self.vector_store = vector_store
+                self._invalidate_search_caches()
             
             # 벡터 저장소 저장
             self._save_vector_store()
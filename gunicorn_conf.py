@@ -0,0 +1,19 @@
+import os
+
+# Cloud Run에서 PORT 환경변수 사용
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"
+
+# 벡터 저장소, 대화 히스토리, 캐시가 프로세스 메모리에 있으므로 워커는 1개로 두고
+# 스레드로 동시 요청을 처리 (임베딩/GCS/LLM 호출은 대부분 네트워크 대기)
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
+threads = int(os.environ.get('GUNICORN_THREADS', '16'))
+
+# Cloud Run 요청 타임아웃(900초)과 맞춤 (전체 임베딩 재구성 등 긴 요청 대응)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '900'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'